@@ -1,19 +1,49 @@
 from typing import List, Optional
 from datetime import datetime
+import asyncio
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import ORJSONResponse, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import func, and_
-from pydantic import BaseModel
+from sqlalchemy import func, and_, bindparam
+from pydantic import BaseModel, ConfigDict
 
 from app.auth.utils import get_current_active_user
+from app.cache import response_cache
 from app.database import get_db
 from app.models import User, Category, Subcategory, Budget, PeriodType, Transaction
-from app.config import settings
+from app.config import settings, AVAILABLE_CURRENCIES_SET, AVAILABLE_CURRENCIES_STR
 
 router = APIRouter(prefix="/api/budgets", tags=["budgets"])
 
+# Columns selected for reads, mapped straight onto BudgetResponse
+BUDGET_COLUMNS = (
+    Budget.id,
+    Budget.category_id,
+    Budget.subcategory_id,
+    Budget.amount,
+    Budget.currency,
+    Budget.start_date,
+    Budget.end_date,
+    Budget.period_type,
+    Budget.created_at,
+    Budget.updated_at,
+)
+
+# Selects a category's id and, if it belongs to the category, the subcategory's id
+CATEGORY_CHECK = select(
+    Category.id.label("category_id"),
+    Subcategory.id.label("subcategory_id")
+).select_from(Category).outerjoin(
+    Subcategory,
+    and_(
+        Subcategory.id == bindparam("subcategory_id"),
+        Subcategory.category_id == Category.id
+    )
+).where(Category.id == bindparam("category_id"))
+
 
 # Schema models
 class BudgetBase(BaseModel):
@@ -45,8 +75,7 @@ class BudgetResponse(BudgetBase):
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class BudgetSummaryItem(BaseModel):
@@ -59,6 +88,8 @@ class BudgetSummaryItem(BaseModel):
     currency: str
     percentage_used: float
 
+    model_config = ConfigDict(from_attributes=True)
+
 
 class BudgetSummary(BaseModel):
     items: List[BudgetSummaryItem]
@@ -77,34 +108,27 @@ async def create_budget(
     current_user: User = Depends(get_current_active_user)
 ) -> Budget:
     """Create a new budget."""
-    # Verify that the category exists
-    result = await db.execute(select(Category).filter(Category.id == budget.category_id))
-    db_category = result.scalars().first()
+    # Verify that the category and, if provided, its subcategory exist in one query
+    result = await db.execute(
+        CATEGORY_CHECK,
+        {"category_id": budget.category_id, "subcategory_id": budget.subcategory_id}
+    )
+    row = result.first()
     
-    if db_category is None:
+    if row is None:
         raise HTTPException(status_code=404, detail="Category not found")
     
-    # Verify that the subcategory exists if provided
-    if budget.subcategory_id:
-        result = await db.execute(
-            select(Subcategory).filter(
-                Subcategory.id == budget.subcategory_id,
-                Subcategory.category_id == budget.category_id
-            )
+    if budget.subcategory_id and row.subcategory_id is None:
+        raise HTTPException(
+            status_code=404, 
+            detail="Subcategory not found or does not belong to the specified category"
         )
-        db_subcategory = result.scalars().first()
-        
-        if db_subcategory is None:
-            raise HTTPException(
-                status_code=404, 
-                detail="Subcategory not found or does not belong to the specified category"
-            )
     
     # Verify that the currency is valid
-    if budget.currency not in settings.available_currencies:
+    if budget.currency not in AVAILABLE_CURRENCIES_SET:
         raise HTTPException(
             status_code=400, 
-            detail=f"Invalid currency. Available currencies: {', '.join(settings.available_currencies)}"
+            detail=f"Invalid currency. Available currencies: {AVAILABLE_CURRENCIES_STR}"
         )
     
     # Verify that start_date is before end_date
@@ -114,14 +138,19 @@ async def create_budget(
             detail="Start date must be before end date"
         )
     
-    db_budget = Budget(**budget.dict())
+    db_budget = Budget(**budget.model_dump())
     db.add(db_budget)
     await db.commit()
-    await db.refresh(db_budget)
+    response_cache.invalidate("budget_summary", "reports")
     return db_budget
 
 
-@router.get("/", response_model=List[BudgetResponse])
+@router.get(
+    "/",
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": List[BudgetResponse]}}
+)
 async def read_budgets(
     skip: int = 0,
     limit: int = 100,
@@ -131,9 +160,9 @@ async def read_budgets(
     active_only: bool = False,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
-) -> List[Budget]:
+) -> Response:
     """Get all budgets with optional filtering."""
-    query = select(Budget)
+    query = select(*BUDGET_COLUMNS)
     
     # Apply filters
     if category_id:
@@ -146,33 +175,135 @@ async def read_budgets(
         query = query.filter(Budget.currency == currency)
     
     if active_only:
-        now = datetime.now()
-        query = query.filter(
-            and_(
-                Budget.start_date <= now,
-                Budget.end_date >= now
-            )
-        )
+        query = query.filter(Budget.is_active)
     
     query = query.offset(skip).limit(limit)
     result = await db.execute(query)
-    return result.scalars().all()
+    
+    # Rows come straight from the database, so skip response validation and encode them in one call
+    return Response(content=orjson.dumps([row._asdict() for row in result]), media_type="application/json")
+
+
+@router.get("/summary", response_model=BudgetSummary)
+@response_cache.cached("budget_summary")
+async def get_budget_summary(
+    start_date: datetime = Query(..., description="Start date for the summary period"),
+    end_date: datetime = Query(..., description="End date for the summary period"),
+    currency: str = Query(settings.default_currency, description="Currency for the summary"),
+    db: AsyncSession = Depends(get_db),
+    transaction_db: AsyncSession = Depends(get_db, use_cache=False),
+    current_user: User = Depends(get_current_active_user)
+) -> BudgetSummary:
+    """Get a summary of budgets vs. actual spending for a period."""
+    # Sum budgets for the period by category and subcategory
+    budget_query = select(
+        Budget.category_id,
+        Budget.subcategory_id,
+        func.sum(Budget.amount)
+    ).where(
+        and_(
+            Budget.currency == currency,
+            Budget.start_date <= end_date,
+            Budget.end_date >= start_date
+        )
+    ).group_by(Budget.category_id, Budget.subcategory_id)
+    
+    # Sum transactions for the period by category and subcategory
+    transaction_query = select(
+        Transaction.category_id,
+        Transaction.subcategory_id,
+        func.sum(Transaction.amount)
+    ).where(
+        and_(
+            Transaction.currency == currency,
+            Transaction.transaction_date >= start_date,
+            Transaction.transaction_date <= end_date
+        )
+    ).group_by(Transaction.category_id, Transaction.subcategory_id)
+    
+    # The two aggregations are independent, so run them concurrently on separate sessions
+    budget_result, transaction_result = await asyncio.gather(
+        db.execute(budget_query),
+        transaction_db.execute(transaction_query)
+    )
+    budget_dict = {(cat_id, subcat_id): amount for cat_id, subcat_id, amount in budget_result}
+    transaction_dict = {(cat_id, subcat_id): amount for cat_id, subcat_id, amount in transaction_result}
+    
+    # Calculate summary
+    summary_items = []
+    total_budget = sum(budget_dict.values())
+    total_actual = sum(transaction_dict.values())
+    
+    # Load category and subcategory names in bulk
+    cat_ids = {key[0] for key in budget_dict}
+    sub_ids = {key[1] for key in budget_dict if key[1]}
+
+    cats = {}
+    if cat_ids:
+        result = await db.execute(select(Category).where(Category.id.in_(cat_ids)))
+        cats = {category.id: category for category in result.scalars()}
+
+    subcats = {}
+    if sub_ids:
+        result = await db.execute(select(Subcategory).where(Subcategory.id.in_(sub_ids)))
+        subcats = {subcategory.id: subcategory for subcategory in result.scalars()}
+
+    # Create summary items
+    for (cat_id, subcat_id), budget_amount in budget_dict.items():
+        category = cats.get(cat_id)
+        subcategory = subcats.get(subcat_id) if subcat_id else None
+
+        # Get actual amount
+        actual_amount = transaction_dict.get((cat_id, subcat_id), 0)
+        
+        # Calculate percentage
+        percentage_used = (actual_amount / budget_amount * 100) if budget_amount > 0 else 0
+        
+        summary_items.append(
+            BudgetSummaryItem.model_construct(
+                category_id=cat_id,
+                category_name=category.name if category else "Unknown",
+                subcategory_id=subcat_id,
+                subcategory_name=subcategory.name if subcategory else None,
+                budget_amount=budget_amount,
+                actual_amount=actual_amount,
+                currency=currency,
+                percentage_used=percentage_used
+            )
+        )
+    
+    # Calculate overall percentage
+    overall_percentage = (total_actual / total_budget * 100) if total_budget > 0 else 0
+    
+    return BudgetSummary(
+        items=summary_items,
+        total_budget=total_budget,
+        total_actual=total_actual,
+        overall_percentage=overall_percentage,
+        currency=currency,
+        period=f"{start_date:%Y-%m-%d} to {end_date:%Y-%m-%d}"
+    )
 
 
-@router.get("/{budget_id}", response_model=BudgetResponse)
+@router.get(
+    "/{budget_id}",
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": BudgetResponse}}
+)
 async def read_budget(
     budget_id: int,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
-) -> Budget:
+) -> ORJSONResponse:
     """Get a specific budget by ID."""
-    result = await db.execute(select(Budget).filter(Budget.id == budget_id))
-    db_budget = result.scalars().first()
+    result = await db.execute(select(*BUDGET_COLUMNS).filter(Budget.id == budget_id))
+    row = result.first()
     
-    if db_budget is None:
+    if row is None:
         raise HTTPException(status_code=404, detail="Budget not found")
     
-    return db_budget
+    return ORJSONResponse(BudgetResponse.model_construct(**row._mapping).model_dump())
 
 
 @router.put("/{budget_id}", response_model=BudgetResponse)
@@ -183,44 +314,39 @@ async def update_budget(
     current_user: User = Depends(get_current_active_user)
 ) -> Budget:
     """Update a budget."""
-    result = await db.execute(select(Budget).filter(Budget.id == budget_id))
-    db_budget = result.scalars().first()
+    db_budget = await db.get(Budget, budget_id)
     
     if db_budget is None:
         raise HTTPException(status_code=404, detail="Budget not found")
     
-    update_data = budget.dict(exclude_unset=True)
+    update_data = budget.model_dump(exclude_unset=True)
     
-    # Verify that the category exists if being updated
-    if "category_id" in update_data:
-        result = await db.execute(select(Category).filter(Category.id == update_data["category_id"]))
-        db_category = result.scalars().first()
-        
-        if db_category is None:
-            raise HTTPException(status_code=404, detail="Category not found")
+    # Verify that the category exists and the subcategory belongs to it, if either is being updated
+    check_category = "category_id" in update_data
+    subcategory_id = update_data.get("subcategory_id")
     
-    # Verify that the subcategory exists and belongs to the category if being updated
-    if "subcategory_id" in update_data and update_data["subcategory_id"] is not None:
+    if check_category or subcategory_id is not None:
         category_id = update_data.get("category_id", db_budget.category_id)
         result = await db.execute(
-            select(Subcategory).filter(
-                Subcategory.id == update_data["subcategory_id"],
-                Subcategory.category_id == category_id
-            )
+            CATEGORY_CHECK,
+            {"category_id": category_id, "subcategory_id": subcategory_id}
         )
-        db_subcategory = result.scalars().first()
+        row = result.first()
         
-        if db_subcategory is None:
+        if check_category and row is None:
+            raise HTTPException(status_code=404, detail="Category not found")
+        
+        if subcategory_id is not None and (row is None or row.subcategory_id is None):
             raise HTTPException(
                 status_code=404, 
                 detail="Subcategory not found or does not belong to the specified category"
             )
     
     # Verify that the currency is valid if being updated
-    if "currency" in update_data and update_data["currency"] not in settings.available_currencies:
+    if "currency" in update_data and update_data["currency"] not in AVAILABLE_CURRENCIES_SET:
         raise HTTPException(
             status_code=400, 
-            detail=f"Invalid currency. Available currencies: {', '.join(settings.available_currencies)}"
+            detail=f"Invalid currency. Available currencies: {AVAILABLE_CURRENCIES_STR}"
         )
     
     # Verify that start_date is before end_date if either is being updated
@@ -237,7 +363,7 @@ async def update_budget(
         setattr(db_budget, key, value)
     
     await db.commit()
-    await db.refresh(db_budget)
+    response_cache.invalidate("budget_summary", "reports")
     return db_budget
 
 
@@ -248,110 +374,11 @@ async def delete_budget(
     current_user: User = Depends(get_current_active_user)
 ) -> None:
     """Delete a budget."""
-    result = await db.execute(select(Budget).filter(Budget.id == budget_id))
-    db_budget = result.scalars().first()
+    db_budget = await db.get(Budget, budget_id)
     
     if db_budget is None:
         raise HTTPException(status_code=404, detail="Budget not found")
     
     await db.delete(db_budget)
     await db.commit()
-
-
-@router.get("/summary", response_model=BudgetSummary)
-async def get_budget_summary(
-    start_date: datetime = Query(..., description="Start date for the summary period"),
-    end_date: datetime = Query(..., description="End date for the summary period"),
-    currency: str = Query(settings.default_currency, description="Currency for the summary"),
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
-) -> BudgetSummary:
-    """Get a summary of budgets vs. actual spending for a period."""
-    # Get all budgets for the period
-    result = await db.execute(
-        select(Budget).filter(
-            and_(
-                Budget.currency == currency,
-                Budget.start_date <= end_date,
-                Budget.end_date >= start_date
-            )
-        )
-    )
-    budgets = result.scalars().all()
-    
-    # Get all transactions for the period
-    result = await db.execute(
-        select(Transaction).filter(
-            and_(
-                Transaction.currency == currency,
-                Transaction.transaction_date >= start_date,
-                Transaction.transaction_date <= end_date
-            )
-        )
-    )
-    transactions = result.scalars().all()
-    
-    # Calculate summary
-    summary_items = []
-    total_budget = 0
-    total_actual = 0
-    
-    # Group budgets by category and subcategory
-    budget_dict = {}
-    for budget in budgets:
-        key = (budget.category_id, budget.subcategory_id)
-        if key not in budget_dict:
-            budget_dict[key] = 0
-        budget_dict[key] += budget.amount
-        total_budget += budget.amount
-    
-    # Group transactions by category and subcategory
-    transaction_dict = {}
-    for transaction in transactions:
-        key = (transaction.category_id, transaction.subcategory_id)
-        if key not in transaction_dict:
-            transaction_dict[key] = 0
-        transaction_dict[key] += transaction.amount
-        total_actual += transaction.amount
-    
-    # Create summary items
-    for (cat_id, subcat_id), budget_amount in budget_dict.items():
-        # Get category and subcategory names
-        result = await db.execute(select(Category).filter(Category.id == cat_id))
-        category = result.scalars().first()
-        
-        subcategory = None
-        if subcat_id:
-            result = await db.execute(select(Subcategory).filter(Subcategory.id == subcat_id))
-            subcategory = result.scalars().first()
-        
-        # Get actual amount
-        actual_amount = transaction_dict.get((cat_id, subcat_id), 0)
-        
-        # Calculate percentage
-        percentage_used = (actual_amount / budget_amount * 100) if budget_amount > 0 else 0
-        
-        summary_items.append(
-            BudgetSummaryItem(
-                category_id=cat_id,
-                category_name=category.name if category else "Unknown",
-                subcategory_id=subcat_id,
-                subcategory_name=subcategory.name if subcategory else None,
-                budget_amount=budget_amount,
-                actual_amount=actual_amount,
-                currency=currency,
-                percentage_used=percentage_used
-            )
-        )
-    
-    # Calculate overall percentage
-    overall_percentage = (total_actual / total_budget * 100) if total_budget > 0 else 0
-    
-    return BudgetSummary(
-        items=summary_items,
-        total_budget=total_budget,
-        total_actual=total_actual,
-        overall_percentage=overall_percentage,
-        currency=currency,
-        period=f"{start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}"
-    )
\ No newline at end of file
+    response_cache.invalidate("budget_summary", "reports")
\ No newline at end of file
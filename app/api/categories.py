@@ -1,16 +1,23 @@
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from pydantic import BaseModel
+from sqlalchemy.orm import raiseload
+from pydantic import BaseModel, ConfigDict
 
+from app.api.subcategories import SubcategoryResponse
 from app.auth.utils import get_current_active_user
+from app.cache import response_cache
 from app.database import get_db
 from app.models import User, Category, Subcategory, CategoryType
 
 router = APIRouter(prefix="/api/categories", tags=["categories"])
 
+# Columns selected for reads, mapped straight onto CategoryResponse
+CATEGORY_COLUMNS = (Category.id, Category.name, Category.type)
+
 
 # Schema models
 class CategoryBase(BaseModel):
@@ -30,12 +37,11 @@ class CategoryUpdate(CategoryBase):
 class CategoryResponse(CategoryBase):
     id: int
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class CategoryWithSubcategories(CategoryResponse):
-    subcategories: List["SubcategoryResponse"] = []
+    subcategories: List[SubcategoryResponse] = []
 
 
 # CRUD operations
@@ -46,46 +52,59 @@ async def create_category(
     current_user: User = Depends(get_current_active_user)
 ) -> Category:
     """Create a new category."""
-    db_category = Category(**category.dict())
+    db_category = Category(**category.model_dump())
     db.add(db_category)
     await db.commit()
-    await db.refresh(db_category)
+    response_cache.invalidate("budget_summary", "reports")
     return db_category
 
 
-@router.get("/", response_model=List[CategoryResponse])
+@router.get(
+    "/",
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": List[CategoryResponse]}}
+)
 async def read_categories(
     skip: int = 0,
     limit: int = 100,
     type_filter: Optional[CategoryType] = None,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
-) -> List[Category]:
+) -> ORJSONResponse:
     """Get all categories with optional filtering by type."""
-    query = select(Category)
+    query = select(*CATEGORY_COLUMNS)
     
     if type_filter:
         query = query.filter(Category.type == type_filter)
     
     query = query.offset(skip).limit(limit)
     result = await db.execute(query)
-    return result.scalars().all()
-
-
-@router.get("/{category_id}", response_model=CategoryResponse)
+    # Rows come straight from the database, so skip response validation
+    return ORJSONResponse([
+        CategoryResponse.model_construct(**row._mapping).model_dump() for row in result
+    ])
+
+
+@router.get(
+    "/{category_id}",
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": CategoryResponse}}
+)
 async def read_category(
     category_id: int,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
-) -> Category:
+) -> ORJSONResponse:
     """Get a specific category by ID."""
-    result = await db.execute(select(Category).filter(Category.id == category_id))
-    db_category = result.scalars().first()
+    result = await db.execute(select(*CATEGORY_COLUMNS).filter(Category.id == category_id))
+    row = result.first()
     
-    if db_category is None:
+    if row is None:
         raise HTTPException(status_code=404, detail="Category not found")
     
-    return db_category
+    return ORJSONResponse(CategoryResponse.model_construct(**row._mapping).model_dump())
 
 
 @router.put("/{category_id}", response_model=CategoryResponse)
@@ -96,18 +115,17 @@ async def update_category(
     current_user: User = Depends(get_current_active_user)
 ) -> Category:
     """Update a category."""
-    result = await db.execute(select(Category).filter(Category.id == category_id))
-    db_category = result.scalars().first()
+    db_category = await db.get(Category, category_id)
     
     if db_category is None:
         raise HTTPException(status_code=404, detail="Category not found")
     
-    update_data = category.dict(exclude_unset=True)
+    update_data = category.model_dump(exclude_unset=True)
     for key, value in update_data.items():
         setattr(db_category, key, value)
     
     await db.commit()
-    await db.refresh(db_category)
+    response_cache.invalidate("budget_summary", "reports")
     return db_category
 
 
@@ -118,34 +136,29 @@ async def delete_category(
     current_user: User = Depends(get_current_active_user)
 ) -> None:
     """Delete a category."""
-    result = await db.execute(select(Category).filter(Category.id == category_id))
-    db_category = result.scalars().first()
+    db_category = await db.get(Category, category_id)
     
     if db_category is None:
         raise HTTPException(status_code=404, detail="Category not found")
     
     await db.delete(db_category)
     await db.commit()
+    response_cache.invalidate("budget_summary", "reports")
 
 
-@router.get("/{category_id}/subcategories", response_model=List["SubcategoryResponse"])
+@router.get("/{category_id}/subcategories", response_model=List[SubcategoryResponse])
 async def read_category_subcategories(
     category_id: int,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ) -> List[Subcategory]:
     """Get all subcategories for a specific category."""
-    result = await db.execute(select(Category).filter(Category.id == category_id))
-    db_category = result.scalars().first()
+    db_category = await db.get(Category, category_id)
     
     if db_category is None:
         raise HTTPException(status_code=404, detail="Category not found")
     
     result = await db.execute(
-        select(Subcategory).filter(Subcategory.category_id == category_id)
+        select(Subcategory).options(raiseload("*")).filter(Subcategory.category_id == category_id)
     )
     return result.scalars().all()
-
-
-# Import at the end to avoid circular imports
-from app.api.subcategories import SubcategoryResponse
\ No newline at end of file
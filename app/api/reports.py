@@ -1,30 +1,72 @@
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
+import asyncio
 import calendar
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy import func, and_, extract
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from app.auth.utils import get_current_active_user
+from app.cache import response_cache
 from app.database import get_db
 from app.models import User, Category, Subcategory, Transaction, Budget, CategoryType
 from app.config import settings
 
 router = APIRouter(prefix="/api/reports", tags=["reports"])
 
+# Chart.js dataset styles; only the label and data vary per request
+BUDGET_STYLE = {
+    "backgroundColor": "rgba(54, 162, 235, 0.2)",
+    "borderColor": "rgba(54, 162, 235, 1)",
+    "borderWidth": 1
+}
+
+ACTUAL_STYLE = {
+    "backgroundColor": "rgba(255, 99, 132, 0.2)",
+    "borderColor": "rgba(255, 99, 132, 1)",
+    "borderWidth": 1
+}
+
+INCOME_STYLE = {
+    "backgroundColor": "rgba(75, 192, 192, 0.2)",
+    "borderColor": "rgba(75, 192, 192, 1)",
+    "borderWidth": 1
+}
+
+EXPENSE_STYLE = ACTUAL_STYLE
+
+NET_STYLE = {
+    "backgroundColor": (
+        "rgba(75, 192, 192, 0.2)",
+        "rgba(255, 99, 132, 0.2)",
+        "rgba(54, 162, 235, 0.2)"
+    ),
+    "borderColor": (
+        "rgba(75, 192, 192, 1)",
+        "rgba(255, 99, 132, 1)",
+        "rgba(54, 162, 235, 1)"
+    ),
+    "borderWidth": 1
+}
+
 
 class DataPoint(BaseModel):
     label: str
     value: float
 
+    model_config = ConfigDict(from_attributes=True)
+
 
 class TrendData(BaseModel):
     labels: List[str]
     datasets: List[Dict[str, Any]]
 
+    model_config = ConfigDict(from_attributes=True)
+
 
 class MonthlyReportData(BaseModel):
     income_by_category: List[DataPoint]
@@ -34,7 +76,8 @@ class MonthlyReportData(BaseModel):
     net_income_expense: TrendData
 
 
-@router.get("/trends", response_model=TrendData)
+@router.get("/trends", response_model=TrendData, response_class=ORJSONResponse)
+@response_cache.cached("reports")
 async def get_budget_trends(
     start_date: datetime = Query(..., description="Start date for the trend data"),
     end_date: datetime = Query(..., description="End date for the trend data"),
@@ -49,22 +92,26 @@ async def get_budget_trends(
     months_diff = (end_date.year - start_date.year) * 12 + end_date.month - start_date.month + 1
     
     # Generate month labels
-    labels = []
-    current_date = start_date.replace(day=1)
-    for _ in range(months_diff):
-        labels.append(current_date.strftime("%b %Y"))
-        # Move to next month
-        if current_date.month == 12:
-            current_date = current_date.replace(year=current_date.year + 1, month=1)
-        else:
-            current_date = current_date.replace(month=current_date.month + 1)
+    labels = [
+        datetime(
+            start_date.year + (start_date.month - 1 + i) // 12,
+            (start_date.month - 1 + i) % 12 + 1,
+            1
+        ).strftime("%b %Y")
+        for i in range(months_diff)
+    ]
     
     # Initialize datasets
     budget_data = [0] * months_diff
     actual_data = [0] * months_diff
     
     # Get budget data
-    budget_query = select(Budget).filter(
+    budget_query = select(
+        Budget.amount,
+        Budget.period_type,
+        Budget.start_date,
+        Budget.end_date
+    ).filter(
         and_(
             Budget.currency == currency,
             Budget.start_date <= end_date,
@@ -79,7 +126,7 @@ async def get_budget_trends(
         budget_query = budget_query.filter(Budget.subcategory_id == subcategory_id)
     
     result = await db.execute(budget_query)
-    budgets = result.scalars().all()
+    budgets = result.all()
     
     # Process budget data
     for budget in budgets:
@@ -90,30 +137,33 @@ async def get_budget_trends(
             monthly_amount = budget.amount
         
         # Determine which months this budget applies to
-        budget_start = max(budget.start_date, start_date)
-        budget_end = min(budget.end_date, end_date)
+        first_index = max(
+            0,
+            (budget.start_date.year - start_date.year) * 12 + budget.start_date.month - start_date.month
+        )
+        last_index = min(
+            months_diff - 1,
+            (budget.end_date.year - start_date.year) * 12 + budget.end_date.month - start_date.month
+        )
         
-        current_month = budget_start.replace(day=1)
-        while current_month <= budget_end:
-            month_index = (current_month.year - start_date.year) * 12 + current_month.month - start_date.month
-            if 0 <= month_index < months_diff:
-                budget_data[month_index] += monthly_amount
-            
-            # Move to next month
-            if current_month.month == 12:
-                current_month = current_month.replace(year=current_month.year + 1, month=1)
-            else:
-                current_month = current_month.replace(month=current_month.month + 1)
+        for month_index in range(first_index, last_index + 1):
+            budget_data[month_index] += monthly_amount
     
-    # Get transaction data
-    transaction_query = select(Transaction).filter(
+    # Sum transaction data by month
+    transaction_year = extract("year", Transaction.transaction_date)
+    transaction_month = extract("month", Transaction.transaction_date)
+    transaction_query = select(
+        transaction_year,
+        transaction_month,
+        func.sum(Transaction.amount)
+    ).filter(
         and_(
             Transaction.currency == currency,
             Transaction.transaction_date >= start_date,
             Transaction.transaction_date <= end_date,
             Transaction.type == CategoryType.EXPENSE  # Only consider expenses for budget comparison
         )
-    )
+    ).group_by(transaction_year, transaction_month)
     
     if category_id:
         transaction_query = transaction_query.filter(Transaction.category_id == category_id)
@@ -122,41 +172,38 @@ async def get_budget_trends(
         transaction_query = transaction_query.filter(Transaction.subcategory_id == subcategory_id)
     
     result = await db.execute(transaction_query)
-    transactions = result.scalars().all()
     
     # Process transaction data
-    for transaction in transactions:
-        month_index = (transaction.transaction_date.year - start_date.year) * 12 + transaction.transaction_date.month - start_date.month
+    for year, month, amount in result:
+        month_index = (int(year) - start_date.year) * 12 + int(month) - start_date.month
         if 0 <= month_index < months_diff:
-            actual_data[month_index] += transaction.amount
+            actual_data[month_index] += amount
     
     # Create datasets
     datasets = [
         {
             "label": "Budget",
             "data": budget_data,
-            "backgroundColor": "rgba(54, 162, 235, 0.2)",
-            "borderColor": "rgba(54, 162, 235, 1)",
-            "borderWidth": 1
+            **BUDGET_STYLE
         },
         {
             "label": "Actual",
             "data": actual_data,
-            "backgroundColor": "rgba(255, 99, 132, 0.2)",
-            "borderColor": "rgba(255, 99, 132, 1)",
-            "borderWidth": 1
+            **ACTUAL_STYLE
         }
     ]
     
     return TrendData(labels=labels, datasets=datasets)
 
 
-@router.get("/monthly/{year}/{month}", response_model=MonthlyReportData)
+@router.get("/monthly/{year}/{month}", response_model=MonthlyReportData, response_class=ORJSONResponse)
+@response_cache.cached("reports")
 async def get_monthly_report(
     year: int,
     month: int,
     currency: str = Query(settings.default_currency, description="Currency for the report"),
     db: AsyncSession = Depends(get_db),
+    budget_db: AsyncSession = Depends(get_db, use_cache=False),
     current_user: User = Depends(get_current_active_user)
 ) -> MonthlyReportData:
     """Get monthly report data for visualization."""
@@ -169,88 +216,90 @@ async def get_monthly_report(
     last_day = calendar.monthrange(year, month)[1]
     end_date = datetime(year, month, last_day, 23, 59, 59)
     
-    # Get all transactions for the month
-    result = await db.execute(
-        select(Transaction).filter(
-            and_(
-                Transaction.currency == currency,
-                Transaction.transaction_date >= start_date,
-                Transaction.transaction_date <= end_date
-            )
+    # Sum transactions for the month by category, type and day
+    transaction_day = extract("day", Transaction.transaction_date)
+    transaction_query = select(
+        Category.name,
+        Transaction.type,
+        transaction_day,
+        func.sum(Transaction.amount)
+    ).select_from(Transaction).outerjoin(
+        Category, Transaction.category_id == Category.id
+    ).filter(
+        and_(
+            Transaction.currency == currency,
+            Transaction.transaction_date >= start_date,
+            Transaction.transaction_date <= end_date
         )
-    )
-    transactions = result.scalars().all()
+    ).group_by(Category.id, Category.name, Transaction.type, transaction_day)
     
-    # Get all budgets for the month
-    result = await db.execute(
-        select(Budget).filter(
-            and_(
-                Budget.currency == currency,
-                Budget.start_date <= end_date,
-                Budget.end_date >= start_date
-            )
+    # Get all expense budgets for the month with their category names
+    budget_query = select(
+        Category.name,
+        Budget.amount,
+        Budget.period_type
+    ).join(
+        Category, Budget.category_id == Category.id
+    ).filter(
+        and_(
+            Budget.currency == currency,
+            Budget.start_date <= end_date,
+            Budget.end_date >= start_date,
+            Category.type == CategoryType.EXPENSE
         )
     )
-    budgets = result.scalars().all()
     
-    # Process income by category
+    # The two queries are independent, so run them concurrently on separate sessions
+    transaction_result, budget_result = await asyncio.gather(
+        db.execute(transaction_query),
+        budget_db.execute(budget_query)
+    )
+    budgets = budget_result.all()
+    
+    # Process income/expense by category and by day
     income_by_category = {}
-    for transaction in transactions:
-        if transaction.type == CategoryType.INCOME:
-            result = await db.execute(select(Category).filter(Category.id == transaction.category_id))
-            category = result.scalars().first()
-            category_name = category.name if category else "Unknown"
-            
-            if category_name not in income_by_category:
-                income_by_category[category_name] = 0
-            
-            income_by_category[category_name] += transaction.amount
+    expense_by_category = {}
+    daily_income = [0] * last_day
+    daily_expense = [0] * last_day
+    
+    for category_name, transaction_type, day, amount in transaction_result:
+        if transaction_type == CategoryType.INCOME:
+            totals = income_by_category
+            daily = daily_income
+        else:
+            totals = expense_by_category
+            daily = daily_expense
+        
+        category_name = category_name or "Unknown"
+        totals[category_name] = totals.get(category_name, 0) + amount
+        daily[int(day) - 1] += amount
     
     income_data = [
-        DataPoint(label=category, value=amount)
+        DataPoint.model_construct(label=category, value=amount)
         for category, amount in income_by_category.items()
     ]
     
-    # Process expense by category
-    expense_by_category = {}
-    for transaction in transactions:
-        if transaction.type == CategoryType.EXPENSE:
-            result = await db.execute(select(Category).filter(Category.id == transaction.category_id))
-            category = result.scalars().first()
-            category_name = category.name if category else "Unknown"
-            
-            if category_name not in expense_by_category:
-                expense_by_category[category_name] = 0
-            
-            expense_by_category[category_name] += transaction.amount
-    
     expense_data = [
-        DataPoint(label=category, value=amount)
+        DataPoint.model_construct(label=category, value=amount)
         for category, amount in expense_by_category.items()
     ]
     
     # Process budget vs actual
     budget_by_category = {}
     for budget in budgets:
-        result = await db.execute(select(Category).filter(Category.id == budget.category_id))
-        category = result.scalars().first()
+        if budget.name not in budget_by_category:
+            budget_by_category[budget.name] = 0
+        
+        # Calculate monthly budget amount
+        if budget.period_type == "yearly":
+            monthly_amount = budget.amount / 12
+        else:
+            monthly_amount = budget.amount
         
-        if category and category.type == CategoryType.EXPENSE:
-            category_name = category.name
-            
-            if category_name not in budget_by_category:
-                budget_by_category[category_name] = 0
-            
-            # Calculate monthly budget amount
-            if budget.period_type == "yearly":
-                monthly_amount = budget.amount / 12
-            else:
-                monthly_amount = budget.amount
-            
-            budget_by_category[category_name] += monthly_amount
+        budget_by_category[budget.name] += monthly_amount
     
     # Create budget vs actual datasets
-    budget_vs_actual_labels = list(set(list(budget_by_category.keys()) + list(expense_by_category.keys())))
+    budget_vs_actual_labels = list(dict.fromkeys((*budget_by_category, *expense_by_category)))
     budget_vs_actual_budget_data = [budget_by_category.get(label, 0) for label in budget_vs_actual_labels]
     budget_vs_actual_actual_data = [expense_by_category.get(label, 0) for label in budget_vs_actual_labels]
     
@@ -260,31 +309,17 @@ async def get_monthly_report(
             {
                 "label": "Budget",
                 "data": budget_vs_actual_budget_data,
-                "backgroundColor": "rgba(54, 162, 235, 0.2)",
-                "borderColor": "rgba(54, 162, 235, 1)",
-                "borderWidth": 1
+                **BUDGET_STYLE
             },
             {
                 "label": "Actual",
                 "data": budget_vs_actual_actual_data,
-                "backgroundColor": "rgba(255, 99, 132, 0.2)",
-                "borderColor": "rgba(255, 99, 132, 1)",
-                "borderWidth": 1
+                **ACTUAL_STYLE
             }
         ]
     )
     
     # Process daily transactions
-    daily_income = [0] * last_day
-    daily_expense = [0] * last_day
-    
-    for transaction in transactions:
-        day_index = transaction.transaction_date.day - 1
-        if transaction.type == CategoryType.INCOME:
-            daily_income[day_index] += transaction.amount
-        else:
-            daily_expense[day_index] += transaction.amount
-    
     daily_labels = [str(i) for i in range(1, last_day + 1)]
     daily_transactions = TrendData(
         labels=daily_labels,
@@ -292,16 +327,12 @@ async def get_monthly_report(
             {
                 "label": "Income",
                 "data": daily_income,
-                "backgroundColor": "rgba(75, 192, 192, 0.2)",
-                "borderColor": "rgba(75, 192, 192, 1)",
-                "borderWidth": 1
+                **INCOME_STYLE
             },
             {
                 "label": "Expense",
                 "data": daily_expense,
-                "backgroundColor": "rgba(255, 99, 132, 0.2)",
-                "borderColor": "rgba(255, 99, 132, 1)",
-                "borderWidth": 1
+                **EXPENSE_STYLE
             }
         ]
     )
@@ -316,17 +347,7 @@ async def get_monthly_report(
             {
                 "label": "Amount",
                 "data": [total_income, total_expense, total_income - total_expense],
-                "backgroundColor": [
-                    "rgba(75, 192, 192, 0.2)",
-                    "rgba(255, 99, 132, 0.2)",
-                    "rgba(54, 162, 235, 0.2)"
-                ],
-                "borderColor": [
-                    "rgba(75, 192, 192, 1)",
-                    "rgba(255, 99, 132, 1)",
-                    "rgba(54, 162, 235, 1)"
-                ],
-                "borderWidth": 1
+                **NET_STYLE
             }
         ]
     )
@@ -1,16 +1,18 @@
 from typing import List, Dict, Optional
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import and_
-from pydantic import BaseModel
+from sqlalchemy import and_, func
+from sqlalchemy.dialects.sqlite import insert
+from pydantic import BaseModel, ConfigDict
 
 from app.auth.utils import get_current_active_user
+from app.cache import rate_cache
 from app.database import get_db
 from app.models import User, CurrencyRate
-from app.config import settings
+from app.config import settings, AVAILABLE_CURRENCIES_SET, AVAILABLE_CURRENCIES_STR
 
 router = APIRouter(prefix="/api/settings", tags=["settings"])
 
@@ -31,8 +33,7 @@ class CurrencyRateResponse(CurrencyRateBase):
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class AvailableCurrencies(BaseModel):
@@ -74,6 +75,31 @@ async def get_currency_rates(
     return result.scalars().all()
 
 
+@router.get("/currencies/rates/latest", response_model=CurrencyRateResponse)
+@rate_cache.cached("latest_rate")
+async def get_latest_currency_rate(
+    from_currency: str = Query(..., description="Currency to convert from"),
+    to_currency: str = Query(..., description="Currency to convert to"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+) -> CurrencyRateResponse:
+    """Get the most recent exchange rate for a currency pair."""
+    result = await db.execute(
+        select(CurrencyRate).filter(
+            and_(
+                CurrencyRate.from_currency == from_currency,
+                CurrencyRate.to_currency == to_currency
+            )
+        ).order_by(CurrencyRate.effective_date.desc()).limit(1)
+    )
+    db_currency_rate = result.scalars().first()
+    
+    if db_currency_rate is None:
+        raise HTTPException(status_code=404, detail="Currency rate not found")
+    
+    return CurrencyRateResponse.model_validate(db_currency_rate)
+
+
 @router.post("/currencies/rates", response_model=CurrencyRateResponse, status_code=status.HTTP_201_CREATED)
 async def create_currency_rate(
     currency_rate: CurrencyRateCreate,
@@ -82,16 +108,16 @@ async def create_currency_rate(
 ) -> CurrencyRate:
     """Create a new currency exchange rate."""
     # Verify that the currencies are valid
-    if currency_rate.from_currency not in settings.available_currencies:
+    if currency_rate.from_currency not in AVAILABLE_CURRENCIES_SET:
         raise HTTPException(
             status_code=400, 
-            detail=f"Invalid from_currency. Available currencies: {', '.join(settings.available_currencies)}"
+            detail=f"Invalid from_currency. Available currencies: {AVAILABLE_CURRENCIES_STR}"
         )
     
-    if currency_rate.to_currency not in settings.available_currencies:
+    if currency_rate.to_currency not in AVAILABLE_CURRENCIES_SET:
         raise HTTPException(
             status_code=400, 
-            detail=f"Invalid to_currency. Available currencies: {', '.join(settings.available_currencies)}"
+            detail=f"Invalid to_currency. Available currencies: {AVAILABLE_CURRENCIES_STR}"
         )
     
     if currency_rate.from_currency == currency_rate.to_currency:
@@ -100,30 +126,17 @@ async def create_currency_rate(
             detail="from_currency and to_currency cannot be the same"
         )
     
-    # Check if a rate already exists for the same currencies and effective date
+    # Insert the rate, or update it if one exists for the same currencies and effective date
+    payload = currency_rate.model_dump()
     result = await db.execute(
-        select(CurrencyRate).filter(
-            and_(
-                CurrencyRate.from_currency == currency_rate.from_currency,
-                CurrencyRate.to_currency == currency_rate.to_currency,
-                CurrencyRate.effective_date == currency_rate.effective_date
-            )
-        )
+        insert(CurrencyRate).values(**payload).on_conflict_do_update(
+            index_elements=["from_currency", "to_currency", "effective_date"],
+            set_={"rate": payload["rate"], "updated_at": func.now()}
+        ).returning(CurrencyRate)
     )
-    existing_rate = result.scalars().first()
-    
-    if existing_rate:
-        # Update the existing rate
-        existing_rate.rate = currency_rate.rate
-        await db.commit()
-        await db.refresh(existing_rate)
-        return existing_rate
-    
-    # Create a new rate
-    db_currency_rate = CurrencyRate(**currency_rate.dict())
-    db.add(db_currency_rate)
+    db_currency_rate = result.scalars().one()
     await db.commit()
-    await db.refresh(db_currency_rate)
+    rate_cache.invalidate("latest_rate")
     return db_currency_rate
 
 
@@ -145,10 +158,10 @@ async def update_user_preferences(
 ) -> Dict[str, str]:
     """Update user preferences."""
     if "default_currency" in preferences:
-        if preferences["default_currency"] not in settings.available_currencies:
+        if preferences["default_currency"] not in AVAILABLE_CURRENCIES_SET:
             raise HTTPException(
                 status_code=400, 
-                detail=f"Invalid currency. Available currencies: {', '.join(settings.available_currencies)}"
+                detail=f"Invalid currency. Available currencies: {AVAILABLE_CURRENCIES_STR}"
             )
         
         current_user.default_currency = preferences["default_currency"]
@@ -3,9 +3,11 @@ from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from pydantic import BaseModel
+from sqlalchemy.orm import raiseload
+from pydantic import BaseModel, ConfigDict
 
 from app.auth.utils import get_current_active_user
+from app.cache import response_cache
 from app.database import get_db
 from app.models import User, Category, Subcategory
 
@@ -30,8 +32,7 @@ class SubcategoryUpdate(BaseModel):
 class SubcategoryResponse(SubcategoryBase):
     id: int
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # CRUD operations
@@ -43,16 +44,15 @@ async def create_subcategory(
 ) -> Subcategory:
     """Create a new subcategory."""
     # Verify that the category exists
-    result = await db.execute(select(Category).filter(Category.id == subcategory.category_id))
-    db_category = result.scalars().first()
+    db_category = await db.get(Category, subcategory.category_id)
     
     if db_category is None:
         raise HTTPException(status_code=404, detail="Category not found")
     
-    db_subcategory = Subcategory(**subcategory.dict())
+    db_subcategory = Subcategory(**subcategory.model_dump())
     db.add(db_subcategory)
     await db.commit()
-    await db.refresh(db_subcategory)
+    response_cache.invalidate("budget_summary", "reports")
     return db_subcategory
 
 
@@ -65,7 +65,7 @@ async def read_subcategories(
     current_user: User = Depends(get_current_active_user)
 ) -> List[Subcategory]:
     """Get all subcategories with optional filtering by category."""
-    query = select(Subcategory)
+    query = select(Subcategory).options(raiseload("*"))
     
     if category_id:
         query = query.filter(Subcategory.category_id == category_id)
@@ -82,8 +82,7 @@ async def read_subcategory(
     current_user: User = Depends(get_current_active_user)
 ) -> Subcategory:
     """Get a specific subcategory by ID."""
-    result = await db.execute(select(Subcategory).filter(Subcategory.id == subcategory_id))
-    db_subcategory = result.scalars().first()
+    db_subcategory = await db.get(Subcategory, subcategory_id)
     
     if db_subcategory is None:
         raise HTTPException(status_code=404, detail="Subcategory not found")
@@ -99,18 +98,16 @@ async def update_subcategory(
     current_user: User = Depends(get_current_active_user)
 ) -> Subcategory:
     """Update a subcategory."""
-    result = await db.execute(select(Subcategory).filter(Subcategory.id == subcategory_id))
-    db_subcategory = result.scalars().first()
+    db_subcategory = await db.get(Subcategory, subcategory_id)
     
     if db_subcategory is None:
         raise HTTPException(status_code=404, detail="Subcategory not found")
     
-    update_data = subcategory.dict(exclude_unset=True)
+    update_data = subcategory.model_dump(exclude_unset=True)
     
     # If category_id is being updated, verify that the category exists
     if "category_id" in update_data:
-        result = await db.execute(select(Category).filter(Category.id == update_data["category_id"]))
-        db_category = result.scalars().first()
+        db_category = await db.get(Category, update_data["category_id"])
         
         if db_category is None:
             raise HTTPException(status_code=404, detail="Category not found")
@@ -119,7 +116,7 @@ async def update_subcategory(
         setattr(db_subcategory, key, value)
     
     await db.commit()
-    await db.refresh(db_subcategory)
+    response_cache.invalidate("budget_summary", "reports")
     return db_subcategory
 
 
@@ -130,11 +127,11 @@ async def delete_subcategory(
     current_user: User = Depends(get_current_active_user)
 ) -> None:
     """Delete a subcategory."""
-    result = await db.execute(select(Subcategory).filter(Subcategory.id == subcategory_id))
-    db_subcategory = result.scalars().first()
+    db_subcategory = await db.get(Subcategory, subcategory_id)
     
     if db_subcategory is None:
         raise HTTPException(status_code=404, detail="Subcategory not found")
     
     await db.delete(db_subcategory)
-    await db.commit()
\ No newline at end of file
+    await db.commit()
+    response_cache.invalidate("budget_summary", "reports")
@@ -1,16 +1,19 @@
 from typing import List, Optional
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import func, and_, extract
-from pydantic import BaseModel
+from sqlalchemy import func, and_, bindparam, case, extract
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 from app.auth.utils import get_current_active_user
+from app.cache import response_cache
 from app.database import get_db
 from app.models import User, Category, Subcategory, Transaction, CategoryType
-from app.config import settings
+from app.models.types import Cents
+from app.config import settings, AVAILABLE_CURRENCIES_SET, AVAILABLE_CURRENCIES_STR
 
 router = APIRouter(prefix="/api/transactions", tags=["transactions"])
 
@@ -45,8 +48,7 @@ class TransactionResponse(TransactionBase):
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class TransactionSummaryItem(BaseModel):
@@ -69,6 +71,37 @@ class TransactionSummary(BaseModel):
     period: str
 
 
+# Serializes transaction pages without FastAPI's per-item response model pass
+TRANSACTION_LIST_ADAPTER = TypeAdapter(List[TransactionResponse])
+
+# Columns selected for list reads, so rows come back as tuples rather than ORM objects
+TRANSACTION_COLUMNS = (
+    Transaction.id,
+    Transaction.category_id,
+    Transaction.subcategory_id,
+    Transaction.amount,
+    Transaction.currency,
+    Transaction.transaction_date,
+    Transaction.description,
+    Transaction.type,
+    Transaction.created_at,
+    Transaction.updated_at,
+)
+
+
+# Selects a category's type and, if it belongs to the category, the subcategory's id
+CATEGORY_CHECK = select(
+    Category.type.label("category_type"),
+    Subcategory.id.label("subcategory_id")
+).select_from(Category).outerjoin(
+    Subcategory,
+    and_(
+        Subcategory.id == bindparam("subcategory_id"),
+        Subcategory.category_id == Category.id
+    )
+).where(Category.id == bindparam("category_id"))
+
+
 # CRUD operations
 @router.post("/", response_model=TransactionResponse, status_code=status.HTTP_201_CREATED)
 async def create_transaction(
@@ -77,50 +110,48 @@ async def create_transaction(
     current_user: User = Depends(get_current_active_user)
 ) -> Transaction:
     """Create a new transaction."""
-    # Verify that the category exists and matches the transaction type
-    result = await db.execute(select(Category).filter(Category.id == transaction.category_id))
-    db_category = result.scalars().first()
+    # Verify that the category exists and matches the transaction type, and that the
+    # subcategory (if provided) belongs to it, in one query
+    result = await db.execute(
+        CATEGORY_CHECK,
+        {"category_id": transaction.category_id, "subcategory_id": transaction.subcategory_id}
+    )
+    row = result.first()
     
-    if db_category is None:
+    if row is None:
         raise HTTPException(status_code=404, detail="Category not found")
     
-    if db_category.type != transaction.type:
+    if row.category_type != transaction.type:
         raise HTTPException(
             status_code=400,
-            detail=f"Category type ({db_category.type}) does not match transaction type ({transaction.type})"
+            detail=f"Category type ({row.category_type}) does not match transaction type ({transaction.type})"
         )
     
-    # Verify that the subcategory exists if provided
-    if transaction.subcategory_id:
-        result = await db.execute(
-            select(Subcategory).filter(
-                Subcategory.id == transaction.subcategory_id,
-                Subcategory.category_id == transaction.category_id
-            )
+    if transaction.subcategory_id and row.subcategory_id is None:
+        raise HTTPException(
+            status_code=404, 
+            detail="Subcategory not found or does not belong to the specified category"
         )
-        db_subcategory = result.scalars().first()
-        
-        if db_subcategory is None:
-            raise HTTPException(
-                status_code=404, 
-                detail="Subcategory not found or does not belong to the specified category"
-            )
     
     # Verify that the currency is valid
-    if transaction.currency not in settings.available_currencies:
+    if transaction.currency not in AVAILABLE_CURRENCIES_SET:
         raise HTTPException(
             status_code=400, 
-            detail=f"Invalid currency. Available currencies: {', '.join(settings.available_currencies)}"
+            detail=f"Invalid currency. Available currencies: {AVAILABLE_CURRENCIES_STR}"
         )
     
-    db_transaction = Transaction(**transaction.dict())
+    db_transaction = Transaction(**transaction.model_dump())
     db.add(db_transaction)
     await db.commit()
-    await db.refresh(db_transaction)
+    response_cache.invalidate("budget_summary", "reports")
     return db_transaction
 
 
-@router.get("/", response_model=List[TransactionResponse])
+@router.get(
+    "/",
+    response_model=None,
+    responses={200: {"model": List[TransactionResponse]}}
+)
 async def read_transactions(
     skip: int = 0,
     limit: int = 100,
@@ -132,9 +163,9 @@ async def read_transactions(
     end_date: Optional[datetime] = None,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
-) -> List[Transaction]:
+) -> Response:
     """Get all transactions with optional filtering."""
-    query = select(Transaction)
+    query = select(*TRANSACTION_COLUMNS)
     
     # Apply filters
     if category_id:
@@ -160,23 +191,123 @@ async def read_transactions(
     
     query = query.offset(skip).limit(limit)
     result = await db.execute(query)
-    return result.scalars().all()
+    
+    # Validate and serialize the whole page in one pydantic-core call
+    transactions = TRANSACTION_LIST_ADAPTER.validate_python(result.all(), from_attributes=True)
+    return Response(content=TRANSACTION_LIST_ADAPTER.dump_json(transactions), media_type="application/json")
 
 
-@router.get("/{transaction_id}", response_model=TransactionResponse)
+@router.get(
+    "/summary",
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": TransactionSummary}}
+)
+async def get_transaction_summary(
+    start_date: datetime = Query(..., description="Start date for the summary period"),
+    end_date: datetime = Query(..., description="End date for the summary period"),
+    currency: str = Query(settings.default_currency, description="Currency for the summary"),
+    group_by: str = Query("category", description="Group by 'category' or 'subcategory'"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+) -> ORJSONResponse:
+    """Get a summary of transactions for a period."""
+    # Validate group_by parameter
+    if group_by not in ["category", "subcategory"]:
+        raise HTTPException(
+            status_code=400,
+            detail="group_by must be 'category' or 'subcategory'"
+        )
+    
+    # Aggregate per group in SQL, splitting income and expense with CASE, with names joined in
+    group_columns = [Transaction.category_id, Category.name, Category.type]
+    if group_by == "subcategory":
+        group_columns += [Transaction.subcategory_id, Subcategory.name]
+    
+    query = (
+        select(
+            *group_columns,
+            func.sum(Transaction.amount),
+            func.count(),
+            # Typed as Cents so the CASE sums are converted back to amounts like the plain SUM
+            func.sum(case((Transaction.type == CategoryType.INCOME, Transaction.amount), else_=0), type_=Cents),
+            func.sum(case((Transaction.type == CategoryType.INCOME, 0), else_=Transaction.amount), type_=Cents)
+        )
+        .outerjoin(Category, Category.id == Transaction.category_id)
+        .filter(
+            and_(
+                Transaction.currency == currency,
+                Transaction.transaction_date >= start_date,
+                Transaction.transaction_date <= end_date
+            )
+        )
+        .group_by(*group_columns)
+    )
+    if group_by == "subcategory":
+        query = query.outerjoin(Subcategory, Subcategory.id == Transaction.subcategory_id)
+    
+    result = await db.execute(query)
+    
+    # Calculate summary
+    summary_items = []
+    total_income = 0.0
+    total_expense = 0.0
+    
+    for row in result:
+        if group_by == "subcategory":
+            cat_id, cat_name, cat_type, subcat_id, subcat_name, amount, count, income, expense = row
+        else:
+            cat_id, cat_name, cat_type, amount, count, income, expense = row
+            subcat_id, subcat_name = None, None
+        
+        summary_items.append(
+            TransactionSummaryItem.model_construct(
+                category_id=cat_id,
+                category_name=cat_name if cat_name is not None else "Unknown",
+                subcategory_id=subcat_id,
+                subcategory_name=subcat_name,
+                total_amount=amount,
+                transaction_count=count,
+                currency=currency,
+                type=cat_type if cat_type is not None else CategoryType.EXPENSE
+            )
+        )
+        
+        total_income += income
+        total_expense += expense
+    
+    # Calculate net amount
+    net_amount = total_income - total_expense
+    
+    summary = TransactionSummary.model_construct(
+        items=summary_items,
+        total_income=total_income,
+        total_expense=total_expense,
+        net_amount=net_amount,
+        currency=currency,
+        period=f"{start_date:%Y-%m-%d} to {end_date:%Y-%m-%d}"
+    )
+    return ORJSONResponse(summary.model_dump())
+
+
+@router.get(
+    "/{transaction_id}",
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": TransactionResponse}}
+)
 async def read_transaction(
     transaction_id: int,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
-) -> Transaction:
+) -> ORJSONResponse:
     """Get a specific transaction by ID."""
-    result = await db.execute(select(Transaction).filter(Transaction.id == transaction_id))
-    db_transaction = result.scalars().first()
+    db_transaction = await db.get(Transaction, transaction_id)
     
     if db_transaction is None:
         raise HTTPException(status_code=404, detail="Transaction not found")
     
-    return db_transaction
+    return ORJSONResponse(TransactionResponse.model_validate(db_transaction).model_dump())
 
 
 @router.put("/{transaction_id}", response_model=TransactionResponse)
@@ -187,59 +318,56 @@ async def update_transaction(
     current_user: User = Depends(get_current_active_user)
 ) -> Transaction:
     """Update a transaction."""
-    result = await db.execute(select(Transaction).filter(Transaction.id == transaction_id))
-    db_transaction = result.scalars().first()
+    db_transaction = await db.get(Transaction, transaction_id)
     
     if db_transaction is None:
         raise HTTPException(status_code=404, detail="Transaction not found")
     
-    update_data = transaction.dict(exclude_unset=True)
+    update_data = transaction.model_dump(exclude_unset=True)
     
     # If category_id or type is being updated, verify that they match
     category_id = update_data.get("category_id", db_transaction.category_id)
     transaction_type = update_data.get("type", db_transaction.type)
     
-    if "category_id" in update_data or "type" in update_data:
-        result = await db.execute(select(Category).filter(Category.id == category_id))
-        db_category = result.scalars().first()
-        
-        if db_category is None:
-            raise HTTPException(status_code=404, detail="Category not found")
-        
-        if db_category.type != transaction_type:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Category type ({db_category.type}) does not match transaction type ({transaction_type})"
-            )
+    check_category = "category_id" in update_data or "type" in update_data
+    subcategory_id = update_data.get("subcategory_id")
     
-    # Verify that the subcategory exists and belongs to the category if being updated
-    if "subcategory_id" in update_data and update_data["subcategory_id"] is not None:
+    if check_category or subcategory_id is not None:
         result = await db.execute(
-            select(Subcategory).filter(
-                Subcategory.id == update_data["subcategory_id"],
-                Subcategory.category_id == category_id
-            )
+            CATEGORY_CHECK,
+            {"category_id": category_id, "subcategory_id": subcategory_id}
         )
-        db_subcategory = result.scalars().first()
+        row = result.first()
         
-        if db_subcategory is None:
+        if check_category:
+            if row is None:
+                raise HTTPException(status_code=404, detail="Category not found")
+            
+            if row.category_type != transaction_type:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Category type ({row.category_type}) does not match transaction type ({transaction_type})"
+                )
+        
+        # Verify that the subcategory exists and belongs to the category if being updated
+        if subcategory_id is not None and (row is None or row.subcategory_id is None):
             raise HTTPException(
                 status_code=404, 
                 detail="Subcategory not found or does not belong to the specified category"
             )
     
     # Verify that the currency is valid if being updated
-    if "currency" in update_data and update_data["currency"] not in settings.available_currencies:
+    if "currency" in update_data and update_data["currency"] not in AVAILABLE_CURRENCIES_SET:
         raise HTTPException(
             status_code=400, 
-            detail=f"Invalid currency. Available currencies: {', '.join(settings.available_currencies)}"
+            detail=f"Invalid currency. Available currencies: {AVAILABLE_CURRENCIES_STR}"
         )
     
     for key, value in update_data.items():
         setattr(db_transaction, key, value)
     
     await db.commit()
-    await db.refresh(db_transaction)
+    response_cache.invalidate("budget_summary", "reports")
     return db_transaction
 
 
@@ -250,101 +378,11 @@ async def delete_transaction(
     current_user: User = Depends(get_current_active_user)
 ) -> None:
     """Delete a transaction."""
-    result = await db.execute(select(Transaction).filter(Transaction.id == transaction_id))
-    db_transaction = result.scalars().first()
+    db_transaction = await db.get(Transaction, transaction_id)
     
     if db_transaction is None:
         raise HTTPException(status_code=404, detail="Transaction not found")
     
     await db.delete(db_transaction)
     await db.commit()
-
-
-@router.get("/summary", response_model=TransactionSummary)
-async def get_transaction_summary(
-    start_date: datetime = Query(..., description="Start date for the summary period"),
-    end_date: datetime = Query(..., description="End date for the summary period"),
-    currency: str = Query(settings.default_currency, description="Currency for the summary"),
-    group_by: str = Query("category", description="Group by 'category' or 'subcategory'"),
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
-) -> TransactionSummary:
-    """Get a summary of transactions for a period."""
-    # Validate group_by parameter
-    if group_by not in ["category", "subcategory"]:
-        raise HTTPException(
-            status_code=400,
-            detail="group_by must be 'category' or 'subcategory'"
-        )
-    
-    # Get all transactions for the period
-    result = await db.execute(
-        select(Transaction).filter(
-            and_(
-                Transaction.currency == currency,
-                Transaction.transaction_date >= start_date,
-                Transaction.transaction_date <= end_date
-            )
-        )
-    )
-    transactions = result.scalars().all()
-    
-    # Calculate summary
-    summary_items = []
-    total_income = 0
-    total_expense = 0
-    
-    # Group transactions by category or subcategory
-    transaction_dict = {}
-    count_dict = {}
-    
-    for transaction in transactions:
-        key = (transaction.category_id, transaction.subcategory_id if group_by == "subcategory" else None)
-        
-        if key not in transaction_dict:
-            transaction_dict[key] = 0
-            count_dict[key] = 0
-        
-        transaction_dict[key] += transaction.amount
-        count_dict[key] += 1
-        
-        if transaction.type == CategoryType.INCOME:
-            total_income += transaction.amount
-        else:
-            total_expense += transaction.amount
-    
-    # Create summary items
-    for (cat_id, subcat_id), total_amount in transaction_dict.items():
-        # Get category and subcategory names
-        result = await db.execute(select(Category).filter(Category.id == cat_id))
-        category = result.scalars().first()
-        
-        subcategory = None
-        if subcat_id:
-            result = await db.execute(select(Subcategory).filter(Subcategory.id == subcat_id))
-            subcategory = result.scalars().first()
-        
-        summary_items.append(
-            TransactionSummaryItem(
-                category_id=cat_id,
-                category_name=category.name if category else "Unknown",
-                subcategory_id=subcat_id,
-                subcategory_name=subcategory.name if subcategory else None,
-                total_amount=total_amount,
-                transaction_count=count_dict[(cat_id, subcat_id)],
-                currency=currency,
-                type=category.type if category else CategoryType.EXPENSE
-            )
-        )
-    
-    # Calculate net amount
-    net_amount = total_income - total_expense
-    
-    return TransactionSummary(
-        items=summary_items,
-        total_income=total_income,
-        total_expense=total_expense,
-        net_amount=net_amount,
-        currency=currency,
-        period=f"{start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}"
-    )
\ No newline at end of file
+    response_cache.invalidate("budget_summary", "reports")
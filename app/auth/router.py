@@ -4,13 +4,12 @@ from typing import Any
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.future import select
 
-from app.auth.utils import authenticate_user, create_access_token, get_current_active_user
+from app.auth.utils import USER_BY_USERNAME, authenticate_user, create_access_token, get_current_active_user
 from app.config import settings
 from app.database import get_db
 from app.models import User
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 router = APIRouter(prefix="/api/auth", tags=["auth"])
 
@@ -31,8 +30,7 @@ class UserResponse(BaseModel):
     username: str
     default_currency: str
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 @router.post("/login", response_model=Token)
@@ -65,7 +63,7 @@ async def register_user(
 ) -> Any:
     """Register a new user."""
     # Check if username already exists
-    result = await db.execute(select(User).filter(User.username == user_data.username))
+    result = await db.execute(USER_BY_USERNAME, {"username": user_data.username})
     existing_user = result.scalars().first()
     
     if existing_user:
@@ -75,7 +73,7 @@ async def register_user(
         )
     
     # Create new user
-    hashed_password = User.get_password_hash(user_data.password)
+    hashed_password = await User.aget_password_hash(user_data.password)
     db_user = User(
         username=user_data.username,
         password_hash=hashed_password,
@@ -84,7 +82,6 @@ async def register_user(
     
     db.add(db_user)
     await db.commit()
-    await db.refresh(db_user)
     
     return db_user
 
@@ -1,9 +1,11 @@
+import time
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
+from jose import JWTError, jwk, jwt
+from sqlalchemy import bindparam
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
@@ -14,15 +16,25 @@ from app.models import User
 # OAuth2 scheme for token authentication
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/auth/login")
 
+# Signing key prepared once; passing the raw secret makes jose rebuild it on every encode and decode
+SIGNING_KEY = jwk.construct(settings.secret_key, settings.algorithm)
+
+# Built once, since every authenticated request looks the user up by name
+USER_BY_USERNAME = select(User).where(User.username == bindparam("username"))
+
+# Verified tokens mapped to (username, user id, expiry), so repeat requests skip JWT decoding
+TOKEN_CACHE_MAXSIZE = 4096
+token_cache: Dict[str, Tuple[str, int, float]] = {}
+
 
 async def authenticate_user(db: AsyncSession, username: str, password: str) -> Optional[User]:
     """Authenticate a user by username and password."""
-    result = await db.execute(select(User).filter(User.username == username))
+    result = await db.execute(USER_BY_USERNAME, {"username": username})
     user = result.scalars().first()
     
     if not user:
         return None
-    if not User.verify_password(password, user.password_hash):
+    if not await User.averify_password(password, user.password_hash):
         return None
     
     return user
@@ -38,7 +50,7 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
         expire = datetime.utcnow() + timedelta(minutes=settings.access_token_expire_minutes)
     
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
+    encoded_jwt = jwt.encode(to_encode, SIGNING_KEY, algorithm=settings.algorithm)
     
     return encoded_jwt
 
@@ -54,16 +66,31 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
     
-    try:
-        payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
-        username: str = payload.get("sub")
-        if username is None:
+    cached = token_cache.get(token)
+    if cached is not None and cached[2] > time.time():
+        username, user_id, _ = cached
+        user = await db.get(User, user_id)
+        # Guard against the id having been reused by a different user
+        if user is not None and user.username != username:
+            user = None
+    else:
+        token_cache.pop(token, None)
+        
+        try:
+            payload = jwt.decode(token, SIGNING_KEY, algorithms=[settings.algorithm])
+            username: str = payload.get("sub")
+            if username is None:
+                raise credentials_exception
+        except JWTError:
             raise credentials_exception
-    except JWTError:
-        raise credentials_exception
-    
-    result = await db.execute(select(User).filter(User.username == username))
-    user = result.scalars().first()
+        
+        result = await db.execute(USER_BY_USERNAME, {"username": username})
+        user = result.scalars().first()
+        
+        if user is not None:
+            if len(token_cache) >= TOKEN_CACHE_MAXSIZE:
+                del token_cache[next(iter(token_cache))]
+            token_cache[token] = (username, user.id, payload["exp"])
     
     if user is None:
         raise credentials_exception
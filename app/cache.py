@@ -0,0 +1,107 @@
+import hashlib
+import inspect
+import time
+import uuid
+from functools import wraps
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from fastapi import Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+
+# Endpoint arguments that don't affect the response, besides database sessions
+IGNORED_KWARGS = {"current_user"}
+
+
+class ResponseCache:
+    """In-process TTL cache for expensive read-only endpoint responses."""
+
+    def __init__(self, expire: int, maxsize: int = 256):
+        self.expire = expire
+        self.maxsize = maxsize
+        self._entries: Dict[Tuple[Hashable, ...], Tuple[float, Any]] = {}
+        # Bumped on every invalidation so ETags change whenever the data does
+        self._instance = uuid.uuid4().hex
+        self._generations: Dict[str, int] = {}
+
+    def get(self, key: Tuple[Hashable, ...]) -> Optional[Any]:
+        """Return a cached value, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+
+        return value
+
+    def set(self, key: Tuple[Hashable, ...], value: Any) -> None:
+        """Store a value, evicting the oldest entry when full."""
+        if key not in self._entries and len(self._entries) >= self.maxsize:
+            del self._entries[next(iter(self._entries))]
+
+        self._entries[key] = (time.monotonic() + self.expire, value)
+
+    def invalidate(self, *prefixes: str) -> None:
+        """Drop every entry cached under the given prefixes."""
+        for prefix in prefixes:
+            self._generations[prefix] = self._generations.get(prefix, 0) + 1
+
+        for key in [key for key in self._entries if key[0] in prefixes]:
+            del self._entries[key]
+
+    def etag(self, key: Tuple[Hashable, ...]) -> str:
+        """Build a weak ETag for a key at the current data generation."""
+        generation = self._generations.get(key[0], 0)
+        digest = hashlib.sha1(repr((self._instance, generation, key)).encode()).hexdigest()
+        return f'W/"{digest}"'
+
+    def cached(self, prefix: str) -> Callable:
+        """Cache an async endpoint's result keyed on its query parameters.
+
+        Responses carry an ETag, and a matching If-None-Match gets a 304
+        before the endpoint runs.
+        """
+        def decorator(func: Callable) -> Callable:
+            @wraps(func)
+            async def wrapper(request: Request, response: Response, **kwargs):
+                key = (prefix, func.__name__, tuple(sorted(
+                    (name, value) for name, value in kwargs.items()
+                    if name not in IGNORED_KWARGS and not isinstance(value, AsyncSession)
+                )))
+                etag = self.etag(key)
+
+                if_none_match = request.headers.get("if-none-match", "")
+                if etag in (tag.strip() for tag in if_none_match.split(",")):
+                    return Response(status_code=304, headers={"ETag": etag})
+
+                value = self.get(key)
+                if value is None:
+                    value = await func(**kwargs)
+                    # Skip caching if a write landed while the endpoint was running
+                    if self.etag(key) == etag:
+                        self.set(key, value)
+
+                response.headers["ETag"] = etag
+                return value
+
+            # Expose the request and response to FastAPI alongside the endpoint's own parameters
+            signature = inspect.signature(func)
+            wrapper.__signature__ = signature.replace(parameters=[
+                *signature.parameters.values(),
+                inspect.Parameter("request", inspect.Parameter.KEYWORD_ONLY, annotation=Request),
+                inspect.Parameter("response", inspect.Parameter.KEYWORD_ONLY, annotation=Response),
+            ])
+            return wrapper
+
+        return decorator
+
+
+# Shared cache for the budget summary and report endpoints
+response_cache = ResponseCache(expire=settings.report_cache_expire_seconds)
+
+# Latest currency rates change rarely, so they are kept longer
+rate_cache = ResponseCache(expire=settings.rate_cache_expire_seconds)
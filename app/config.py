@@ -14,6 +14,15 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 # Database settings
 DATABASE_URL = os.getenv("DATABASE_URL", f"sqlite:///{BASE_DIR}/data/budget.db")
 
+# Database connection pool settings
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+
+# Create missing tables and indexes at startup; set to 0 once the schema is provisioned
+INIT_DB = os.getenv("BUDGET_INIT_DB", "1") == "1"
+
 # JWT settings
 SECRET_KEY = os.getenv("SECRET_KEY", "your_secret_key_here_change_in_production")
 ALGORITHM = "HS256"
@@ -31,6 +40,15 @@ CORS_ORIGINS = [
     "http://127.0.0.1:8000",
 ]
 
+# Seconds to keep cached budget summary and report responses
+REPORT_CACHE_EXPIRE_SECONDS = int(os.getenv("REPORT_CACHE_EXPIRE_SECONDS", "60"))
+
+# Seconds to keep cached latest currency rates
+RATE_CACHE_EXPIRE_SECONDS = int(os.getenv("RATE_CACHE_EXPIRE_SECONDS", "300"))
+
+# Seconds browsers may reuse static assets before revalidating
+STATIC_CACHE_MAX_AGE = int(os.getenv("STATIC_CACHE_MAX_AGE", "3600"))
+
 # Application settings
 APP_NAME = "Budget Tracker"
 APP_VERSION = "1.0.0"
@@ -42,13 +60,25 @@ class Settings(BaseModel):
     app_version: str = APP_VERSION
     app_description: str = APP_DESCRIPTION
     database_url: str = DATABASE_URL
+    db_pool_size: int = DB_POOL_SIZE
+    db_max_overflow: int = DB_MAX_OVERFLOW
+    db_pool_timeout: int = DB_POOL_TIMEOUT
+    db_pool_recycle: int = DB_POOL_RECYCLE
+    init_db: bool = INIT_DB
     secret_key: str = SECRET_KEY
     algorithm: str = ALGORITHM
     access_token_expire_minutes: int = ACCESS_TOKEN_EXPIRE_MINUTES
     available_currencies: List[str] = AVAILABLE_CURRENCIES
     default_currency: str = DEFAULT_CURRENCY
     cors_origins: List[str] = CORS_ORIGINS
+    report_cache_expire_seconds: int = REPORT_CACHE_EXPIRE_SECONDS
+    rate_cache_expire_seconds: int = RATE_CACHE_EXPIRE_SECONDS
+    static_cache_max_age: int = STATIC_CACHE_MAX_AGE
 
 
 # Create settings instance
-settings = Settings()
\ No newline at end of file
+settings = Settings()
+
+# Precomputed for currency validation in the API handlers
+AVAILABLE_CURRENCIES_SET = frozenset(settings.available_currencies)
+AVAILABLE_CURRENCIES_STR = ", ".join(settings.available_currencies)
\ No newline at end of file
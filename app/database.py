@@ -1,4 +1,5 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, inspect, text
+from sqlalchemy.schema import CreateTable
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
@@ -10,11 +11,46 @@ from app.config import settings
 # Convert sqlite:/// to sqlite+aiosqlite:/// for async support
 SQLALCHEMY_DATABASE_URL = settings.database_url.replace("sqlite://", "sqlite+aiosqlite://")
 
+# Size the connection pool so concurrent requests don't queue on checkout.
+# In-memory SQLite uses a single static connection and takes no pool arguments.
+pool_args = {}
+if ":memory:" not in SQLALCHEMY_DATABASE_URL:
+    pool_args = {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": True,
+    }
+
 engine = create_async_engine(
     SQLALCHEMY_DATABASE_URL, 
-    connect_args={"check_same_thread": False} if "sqlite" in SQLALCHEMY_DATABASE_URL else {}
+    connect_args={"check_same_thread": False} if "sqlite" in SQLALCHEMY_DATABASE_URL else {},
+    **pool_args
+)
+
+# SQLite connection tuning; WAL lets readers run alongside a writer in file databases
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA foreign_keys=ON",
 )
 
+
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Apply SQLITE_PRAGMAS to a new DBAPI connection."""
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+if SQLALCHEMY_DATABASE_URL.startswith("sqlite"):
+    event.listen(engine.sync_engine, "connect", set_sqlite_pragmas)
+
 # Create async session
 async_session_factory = sessionmaker(
     engine, 
@@ -25,15 +61,16 @@ async_session_factory = sessionmaker(
 
 # Base class for SQLAlchemy models
 class Base(DeclarativeBase):
-    pass
+    # Fetch server-generated columns (created_at, updated_at) with RETURNING during flush,
+    # so handlers don't need a refresh SELECT after committing
+    __mapper_args__ = {"eager_defaults": True}
 
 
-# Dependency to get DB session
+# Dependency to get DB session; write endpoints commit explicitly, so reads skip the commit
 async def get_db():
     async with async_session_factory() as session:
         try:
             yield session
-            await session.commit()
         except Exception:
             await session.rollback()
             raise
@@ -41,8 +78,92 @@ async def get_db():
             await session.close()
 
 
+def create_missing_indexes(connection):
+    """Create indexes added to models after their tables were created."""
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(connection, checkfirst=True)
+
+
+def migrate_amounts_to_cents(connection):
+    """Move float amount columns created before amounts were stored as integer cents."""
+    for table in ("budgets", "transactions"):
+        columns = {column["name"] for column in inspect(connection).get_columns(table)}
+        if "amount" not in columns or "amount_cents" in columns:
+            continue
+        
+        connection.execute(text(f"ALTER TABLE {table} ADD COLUMN amount_cents BIGINT NOT NULL DEFAULT 0"))
+        connection.execute(text(f"UPDATE {table} SET amount_cents = CAST(ROUND(amount * 100) AS INTEGER)"))
+        connection.execute(text(f"ALTER TABLE {table} DROP COLUMN amount"))
+
+
+def migrate_enums_to_codes(connection):
+    """Rewrite enum names stored by the old Enum columns as SmallEnum integer codes."""
+    from app.models.types import SmallEnum
+    
+    for table in Base.metadata.sorted_tables:
+        for column in table.columns:
+            if not isinstance(column.type, SmallEnum):
+                continue
+            
+            names = [member.name for member in column.type.enum_class]
+            cases = " ".join(f"WHEN '{name}' THEN {code}" for code, name in enumerate(names))
+            in_list = ", ".join(f"'{name}'" for name in names)
+            connection.execute(text(
+                f"UPDATE {table.name} SET {column.name} = CASE {column.name} {cases} END "
+                f"WHERE {column.name} IN ({in_list})"
+            ))
+
+
+def migrate_foreign_keys_to_cascade(connection):
+    """Rebuild tables whose foreign keys were created without ON DELETE CASCADE."""
+    for table in Base.metadata.sorted_tables:
+        cascading = {fk.parent.name for fk in table.foreign_keys if fk.ondelete == "CASCADE"}
+        # The inspector doesn't report ON DELETE actions for SQLite, so ask SQLite directly
+        existing = {
+            fk["from"]
+            for fk in connection.execute(text(f"PRAGMA foreign_key_list({table.name})")).mappings()
+            if fk["on_delete"] == "CASCADE"
+        }
+        if cascading <= existing:
+            continue
+        
+        # SQLite can't alter constraints, so copy the rows into a fresh table and swap it in;
+        # indexes go with the old table and are recreated by create_missing_indexes
+        columns = ", ".join(
+            column["name"] for column in inspect(connection).get_columns(table.name) if column["name"] in table.c
+        )
+        ddl = str(CreateTable(table).compile(dialect=connection.dialect))
+        connection.execute(text(ddl.replace(f"CREATE TABLE {table.name} ", f"CREATE TABLE {table.name}_new ", 1)))
+        connection.execute(text(f"INSERT INTO {table.name}_new ({columns}) SELECT {columns} FROM {table.name}"))
+        connection.execute(text(f"DROP TABLE {table.name}"))
+        connection.execute(text(f"ALTER TABLE {table.name}_new RENAME TO {table.name}"))
+
+
+async def prewarm_pool():
+    """Open the pool's connections up front so the first requests don't wait on connecting."""
+    if not pool_args:
+        return
+    
+    connections = [await engine.connect() for _ in range(settings.db_pool_size)]
+    for connection in connections:
+        await connection.close()
+
+
 # Initialize database
 async def init_db():
     async with engine.begin() as conn:
         # Create all tables
-        await conn.run_sync(Base.metadata.create_all)
\ No newline at end of file
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(migrate_amounts_to_cents)
+        await conn.run_sync(migrate_enums_to_codes)
+    
+    async with engine.connect() as conn:
+        # Rebuilding tables needs foreign key enforcement off, and SQLite ignores that PRAGMA
+        # inside a transaction, so set it before anything begins one
+        await conn.exec_driver_sql("PRAGMA foreign_keys=OFF")
+        await conn.run_sync(migrate_foreign_keys_to_cascade)
+        # create_all skips tables that already exist, so add any new indexes separately
+        await conn.run_sync(create_missing_indexes)
+        await conn.commit()
+        await conn.exec_driver_sql("PRAGMA foreign_keys=ON")
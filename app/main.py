@@ -1,19 +1,33 @@
 import os
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response
 
 from app.config import settings
-from app.database import init_db
+from app.database import engine, init_db, prewarm_pool
 from app.auth.router import router as auth_router
 from app.api import routers
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Prepare the database on startup and release its connections on shutdown."""
+    if settings.init_db:
+        await init_db()
+    await prewarm_pool()
+    yield
+    await engine.dispose()
+
+
 # Create FastAPI app
 app = FastAPI(
     title=settings.app_name,
     description=settings.app_description,
-    version=settings.app_version
+    version=settings.app_version,
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Add CORS middleware
@@ -30,17 +44,24 @@ app.include_router(auth_router)
 for router in routers:
     app.include_router(router)
 
+class CachedStaticFiles(StaticFiles):
+    """Static files that browsers may cache for a while before revalidating."""
+
+    def file_response(self, *args, **kwargs) -> Response:
+        response = super().file_response(*args, **kwargs)
+        response.headers["Cache-Control"] = f"public, max-age={settings.static_cache_max_age}"
+        return response
+
+
 # Mount static files
-app.mount("/static", StaticFiles(directory="app/static"), name="static")
+app.mount("/static", CachedStaticFiles(directory="app/static"), name="static")
+
+# The index page never changes at runtime, so read it once
+with open("app/static/index.html", "rb") as index_file:
+    INDEX_HTML = index_file.read()
 
 
-@app.get("/")
+@app.get("/", response_class=HTMLResponse)
 async def read_root():
     """Serve the index.html file."""
-    return FileResponse("app/static/index.html")
-
-
-@app.on_event("startup")
-async def startup_event():
-    """Initialize the database on startup."""
-    await init_db()
\ No newline at end of file
+    return HTMLResponse(INDEX_HTML, headers={"Cache-Control": "no-cache"})
@@ -1,10 +1,14 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Enum
+from typing import Optional
+
+from sqlalchemy import DateTime, ForeignKey, Index, and_
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.ext.hybrid import hybrid_method, hybrid_property
 import enum
 from datetime import datetime
 
 from app.database import Base
+from app.models.types import Cents, SmallEnum
 
 
 class PeriodType(str, enum.Enum):
@@ -15,23 +19,48 @@ class PeriodType(str, enum.Enum):
 class Budget(Base):
     __tablename__ = "budgets"
 
-    id = Column(Integer, primary_key=True, index=True)
-    category_id = Column(Integer, ForeignKey("categories.id"))
-    subcategory_id = Column(Integer, ForeignKey("subcategories.id"), nullable=True)
-    amount = Column(Float)
-    currency = Column(String, default="ZAR")
-    start_date = Column(DateTime)
-    end_date = Column(DateTime)
-    period_type = Column(Enum(PeriodType), default=PeriodType.MONTHLY)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
-
-    # Relationships
-    category = relationship("Category", back_populates="budgets")
-    subcategory = relationship("Subcategory", back_populates="budgets")
-
-    @property
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    category_id: Mapped[Optional[int]] = mapped_column(ForeignKey("categories.id", ondelete="CASCADE"))
+    subcategory_id: Mapped[Optional[int]] = mapped_column(ForeignKey("subcategories.id", ondelete="CASCADE"))
+    # Integer cents in the database, so SUMs are exact; the attribute still reads as a float
+    amount: Mapped[float] = mapped_column("amount_cents", Cents)
+    currency: Mapped[Optional[str]] = mapped_column(default="ZAR")
+    start_date: Mapped[Optional[datetime]] = mapped_column()
+    end_date: Mapped[Optional[datetime]] = mapped_column()
+    period_type: Mapped[Optional[PeriodType]] = mapped_column(SmallEnum(PeriodType), default=PeriodType.MONTHLY)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), onupdate=func.now())
+
+    # Relationships; to-one sides raise rather than lazy load, so request them with loader options
+    category: Mapped["Category"] = relationship(back_populates="budgets", lazy="raise_on_sql")
+    subcategory: Mapped[Optional["Subcategory"]] = relationship(back_populates="budgets", lazy="raise_on_sql")
+
+    # Covers the currency + overlapping period filter of the summary/report queries,
+    # the active budget filter, and budget lookups by category
+    __table_args__ = (
+        Index("ix_budget_ccy_dates", "currency", "start_date", "end_date"),
+        Index("ix_budget_active", "start_date", "end_date"),
+        Index("ix_budget_cat_range", "category_id", "start_date", "end_date"),
+    )
+
+    @hybrid_method
+    def is_active_at(self, now):
+        """Check if the budget is active at the given time."""
+        return self.start_date <= now <= self.end_date
+
+    @is_active_at.expression
+    def is_active_at(cls, now):
+        return and_(cls.start_date <= now, cls.end_date >= now)
+
+    @hybrid_property
     def is_active(self):
-        """Check if the budget is currently active."""
-        now = datetime.now()
-        return self.start_date <= now <= self.end_date
\ No newline at end of file
+        """Check if the budget is currently active.
+
+        Loops over many budgets should call is_active_at with one shared timestamp instead.
+        """
+        return self.is_active_at(datetime.now())
+
+    @is_active.expression
+    def is_active(cls):
+        # Bind the local time like the Python side; SQLite's CURRENT_TIMESTAMP is UTC
+        return cls.is_active_at(datetime.now())
\ No newline at end of file
@@ -1,9 +1,13 @@
-from sqlalchemy import Column, Integer, String, DateTime, Enum, ForeignKey
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import DateTime, ForeignKey
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapped, declared_attr, mapped_column, relationship
 import enum
 
 from app.database import Base
+from app.models.types import SmallEnum
 
 
 class CategoryType(str, enum.Enum):
@@ -11,31 +15,53 @@ class CategoryType(str, enum.Enum):
     EXPENSE = "expense"
 
 
-class Category(Base):
+class BudgetOwnerMixin:
+    """Budgets and transactions belonging to a category or subcategory.
+    
+    Subclasses set _owner_attr to the Budget/Transaction attribute that points back at them.
+    Children are deleted by the foreign keys' ON DELETE CASCADE rather than loaded and
+    deleted one by one.
+    """
+    
+    @declared_attr
+    def budgets(cls) -> Mapped[List["Budget"]]:
+        return relationship(
+            "Budget", back_populates=cls._owner_attr, cascade="all, delete-orphan", passive_deletes=True
+        )
+    
+    @declared_attr
+    def transactions(cls) -> Mapped[List["Transaction"]]:
+        return relationship(
+            "Transaction", back_populates=cls._owner_attr, cascade="all, delete-orphan", passive_deletes=True
+        )
+
+
+class Category(BudgetOwnerMixin, Base):
     __tablename__ = "categories"
 
-    id = Column(Integer, primary_key=True, index=True)
-    name = Column(String, index=True)
-    type = Column(Enum(CategoryType), index=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    name: Mapped[Optional[str]] = mapped_column(index=True)
+    type: Mapped[Optional[CategoryType]] = mapped_column(SmallEnum(CategoryType), index=True)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), onupdate=func.now())
 
-    # Relationships
-    subcategories = relationship("Subcategory", back_populates="category", cascade="all, delete-orphan")
-    budgets = relationship("Budget", back_populates="category", cascade="all, delete-orphan")
-    transactions = relationship("Transaction", back_populates="category", cascade="all, delete-orphan")
+    # Relationships; budgets and transactions come from BudgetOwnerMixin
+    _owner_attr = "category"
+    subcategories: Mapped[List["Subcategory"]] = relationship(
+        back_populates="category", cascade="all, delete-orphan", passive_deletes=True
+    )
 
 
-class Subcategory(Base):
+class Subcategory(BudgetOwnerMixin, Base):
     __tablename__ = "subcategories"
 
-    id = Column(Integer, primary_key=True, index=True)
-    name = Column(String, index=True)
-    category_id = Column(Integer, ForeignKey("categories.id"))
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    name: Mapped[Optional[str]] = mapped_column(index=True)
+    category_id: Mapped[Optional[int]] = mapped_column(ForeignKey("categories.id", ondelete="CASCADE"))
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), onupdate=func.now())
 
-    # Relationships
-    category = relationship("Category", back_populates="subcategories")
-    budgets = relationship("Budget", back_populates="subcategory", cascade="all, delete-orphan")
-    transactions = relationship("Transaction", back_populates="subcategory", cascade="all, delete-orphan")
\ No newline at end of file
+    # Relationships; to-one sides raise rather than lazy load, so request them with loader options.
+    # Budgets and transactions come from BudgetOwnerMixin
+    _owner_attr = "subcategory"
+    category: Mapped["Category"] = relationship(back_populates="subcategories", lazy="raise_on_sql")
\ No newline at end of file
@@ -1,4 +1,8 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, UniqueConstraint
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import DateTime, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 
 from app.database import Base
@@ -7,13 +11,13 @@ from app.database import Base
 class CurrencyRate(Base):
     __tablename__ = "currency_rates"
 
-    id = Column(Integer, primary_key=True, index=True)
-    from_currency = Column(String)
-    to_currency = Column(String)
-    rate = Column(Float)
-    effective_date = Column(DateTime)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    from_currency: Mapped[Optional[str]] = mapped_column()
+    to_currency: Mapped[Optional[str]] = mapped_column()
+    rate: Mapped[Optional[float]] = mapped_column()
+    effective_date: Mapped[Optional[datetime]] = mapped_column()
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), onupdate=func.now())
 
     # Ensure unique combination of from_currency, to_currency, and effective_date
     __table_args__ = (
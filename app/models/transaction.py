@@ -1,26 +1,40 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Enum
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import DateTime, ForeignKey, Index
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 import enum
 
 from app.database import Base
+from app.models.types import Cents, SmallEnum
 from app.models.category import CategoryType
 
 
 class Transaction(Base):
     __tablename__ = "transactions"
 
-    id = Column(Integer, primary_key=True, index=True)
-    category_id = Column(Integer, ForeignKey("categories.id"))
-    subcategory_id = Column(Integer, ForeignKey("subcategories.id"), nullable=True)
-    amount = Column(Float)
-    currency = Column(String, default="ZAR")
-    transaction_date = Column(DateTime)
-    description = Column(String)
-    type = Column(Enum(CategoryType))
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    category_id: Mapped[Optional[int]] = mapped_column(ForeignKey("categories.id", ondelete="CASCADE"))
+    subcategory_id: Mapped[Optional[int]] = mapped_column(ForeignKey("subcategories.id", ondelete="CASCADE"))
+    # Integer cents in the database, so SUMs are exact; the attribute still reads as a float
+    amount: Mapped[float] = mapped_column("amount_cents", Cents)
+    currency: Mapped[Optional[str]] = mapped_column(default="ZAR")
+    transaction_date: Mapped[Optional[datetime]] = mapped_column()
+    description: Mapped[Optional[str]] = mapped_column()
+    type: Mapped[Optional[CategoryType]] = mapped_column(SmallEnum(CategoryType))
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), onupdate=func.now())
+
+    # Relationships; to-one sides raise rather than lazy load, so request them with loader options
+    category: Mapped["Category"] = relationship(back_populates="transactions", lazy="raise_on_sql")
+    subcategory: Mapped[Optional["Subcategory"]] = relationship(back_populates="transactions", lazy="raise_on_sql")
 
-    # Relationships
-    category = relationship("Category", back_populates="transactions")
-    subcategory = relationship("Subcategory", back_populates="transactions")
\ No newline at end of file
+    # Covers the currency + date range filter and category grouping of the summary/report queries,
+    # and the filters of the transaction list, which is always ordered by date
+    __table_args__ = (
+        Index("ix_txn_ccy_date_cat", "currency", "transaction_date", "category_id", "subcategory_id"),
+        Index("ix_tx_date_currency", "transaction_date", "currency"),
+        Index("ix_tx_cat_date", "category_id", "transaction_date"),
+        Index("ix_tx_subcat_date", "subcategory_id", "transaction_date"),
+    )
\ No newline at end of file
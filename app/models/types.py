@@ -0,0 +1,44 @@
+from sqlalchemy import BigInteger, SmallInteger
+from sqlalchemy.types import TypeDecorator
+
+
+class Cents(TypeDecorator):
+    """Money stored as integer minor units and exposed as a float amount."""
+
+    impl = BigInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return round(value * 100)
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return value / 100
+
+
+class SmallEnum(TypeDecorator):
+    """Enum stored as a small integer code: the member's position in the enum definition.
+
+    New members must be appended so existing codes keep their meaning.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_class):
+        super().__init__()
+        self.enum_class = enum_class
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return list(self.enum_class).index(self.enum_class(value))
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        # int() also accepts the text codes left in columns migrated from the old Enum type
+        return list(self.enum_class)[int(value)]
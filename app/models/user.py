@@ -1,23 +1,46 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import DateTime
+from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 from passlib.context import CryptContext
+from passlib.hash import bcrypt
 
 from app.database import Base
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing context; new hashes use Argon2id, bcrypt is kept to verify existing hashes
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__type="ID",
+    argon2__memory_cost=65536,
+    argon2__time_cost=3,
+    argon2__parallelism=1
+)
+
+# Verify legacy bcrypt hashes with the compiled bcrypt package, never a pure-Python fallback
+bcrypt.set_backend("bcrypt")
+
+# Hashing releases the GIL, so one thread per core runs hashes in parallel while capping
+# how many 64 MiB Argon2 computations can be in flight at once
+hash_executor = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="password-hash")
 
 
 class User(Base):
     __tablename__ = "users"
 
-    id = Column(Integer, primary_key=True, index=True)
-    username = Column(String, unique=True, index=True)
-    password_hash = Column(String)
-    default_currency = Column(String, default="ZAR")
-    is_active = Column(Boolean, default=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    username: Mapped[Optional[str]] = mapped_column(unique=True, index=True)
+    password_hash: Mapped[Optional[str]] = mapped_column()
+    default_currency: Mapped[Optional[str]] = mapped_column(default="ZAR")
+    is_active: Mapped[Optional[bool]] = mapped_column(default=True)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), onupdate=func.now())
 
     @staticmethod
     def verify_password(plain_password, hashed_password):
@@ -27,4 +50,16 @@ class User(Base):
     @staticmethod
     def get_password_hash(password):
         """Generate password hash."""
-        return pwd_context.hash(password)
\ No newline at end of file
+        return pwd_context.hash(password)
+
+    @staticmethod
+    async def averify_password(plain_password, hashed_password):
+        """Verify a password against a hash without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(hash_executor, pwd_context.verify, plain_password, hashed_password)
+
+    @staticmethod
+    async def aget_password_hash(password):
+        """Generate password hash without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(hash_executor, pwd_context.hash, password)
\ No newline at end of file
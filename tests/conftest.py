@@ -0,0 +1,97 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from app.main import app
+from app.database import Base, get_db, set_sqlite_pragmas
+from app.auth.utils import create_access_token
+from app.models.user import User, pwd_context
+
+# Cheap hashing parameters keep the tests CPU-bound on the app rather than on hashing
+pwd_context.update(argon2__memory_cost=1024, argon2__time_cost=1, bcrypt__rounds=4)
+# Hashed once so fixtures can insert users without paying for a hash per test
+TEST_PASSWORD_HASH = pwd_context.hash("testpassword")
+
+# Create test database
+TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+# One shared connection keeps the in-memory schema alive across sessions
+engine = create_async_engine(
+    TEST_DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool
+)
+# Same connection tuning as the app engine; in-memory databases keep their own journal mode
+event.listen(engine.sync_engine, "connect", set_sqlite_pragmas)
+
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+
+@pytest.fixture(scope="session")
+async def setup_database():
+    """Create the schema once for the whole test run."""
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+
+
+@pytest.fixture
+async def db_session(setup_database):
+    """Run the test in an outer transaction that is rolled back afterwards."""
+    async with engine.connect() as conn:
+        trans = await conn.begin()
+        
+        # Every session joins the outer transaction; their commits don't end it, so the
+        # final rollback undoes everything the test and the app wrote
+        def make_session():
+            return AsyncSession(bind=conn, expire_on_commit=False, join_transaction_mode="rollback_only")
+        
+        # One session per dependency, as the app may run sessions concurrently
+        async def override_get_db():
+            async with make_session() as session:
+                yield session
+        
+        app.dependency_overrides[get_db] = override_get_db
+        async with make_session() as session:
+            yield session
+        app.dependency_overrides.pop(get_db)
+        
+        await trans.rollback()
+
+
+@pytest.fixture
+async def registered_user(db_session):
+    """Insert the test user directly instead of going through /register."""
+    user = User(username="testuser", password_hash=TEST_PASSWORD_HASH, default_currency="ZAR")
+    db_session.add(user)
+    await db_session.commit()
+    return user
+
+
+@pytest.fixture
+def auth_headers(registered_user):
+    token = create_access_token({"sub": registered_user.username})
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+def no_lazy_loads():
+    """Fail the test if any relationship is lazy loaded while it runs."""
+    lazy_loads = []
+    
+    def record_lazy_load(orm_execute_state):
+        if orm_execute_state.lazy_loaded_from is not None:
+            lazy_loads.append(str(orm_execute_state.statement))
+    
+    event.listen(Session, "do_orm_execute", record_lazy_load)
+    yield
+    event.remove(Session, "do_orm_execute", record_lazy_load)
+    
+    assert not lazy_loads, f"Unexpected lazy loads: {lazy_loads}"
@@ -0,0 +1,81 @@
+import pytest
+
+
+@pytest.fixture
+def category_id(client, auth_headers):
+    response = client.post("/api/categories/", headers=auth_headers, json={"name": "Rent", "type": "expense"})
+    return response.json()["id"]
+
+
+@pytest.mark.asyncio
+async def test_create_and_read_budget(client, auth_headers, category_id, no_lazy_loads):
+    response = client.post(
+        "/api/budgets/",
+        headers=auth_headers,
+        json={"category_id": category_id, "amount": 1000, "start_date": "2024-01-01T00:00:00", "end_date": "2024-01-31T00:00:00"}
+    )
+    assert response.status_code == 201
+    budget_id = response.json()["id"]
+    
+    response = client.get(f"/api/budgets/{budget_id}", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json()["amount"] == 1000
+    
+    response = client.get("/api/budgets/", headers=auth_headers)
+    assert response.status_code == 200
+    assert [budget["id"] for budget in response.json()] == [budget_id]
+
+
+@pytest.mark.asyncio
+async def test_budget_summary(client, auth_headers, category_id, no_lazy_loads):
+    client.post(
+        "/api/budgets/",
+        headers=auth_headers,
+        json={"category_id": category_id, "amount": 1000, "start_date": "2024-01-01T00:00:00", "end_date": "2024-01-31T00:00:00"}
+    )
+    client.post(
+        "/api/transactions/",
+        headers=auth_headers,
+        json={"category_id": category_id, "amount": 400, "transaction_date": "2024-01-10T00:00:00", "description": "rent", "type": "expense"}
+    )
+    
+    response = client.get(
+        "/api/budgets/summary",
+        headers=auth_headers,
+        params={"start_date": "2024-01-01T00:00:00", "end_date": "2024-01-31T23:59:59"}
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total_budget"] == 1000
+    assert data["total_actual"] == 400
+    assert data["items"][0]["category_name"] == "Rent"
+    
+    # Unchanged data is answered from the ETag without a body
+    response = client.get(
+        "/api/budgets/summary",
+        headers={**auth_headers, "If-None-Match": response.headers["ETag"]},
+        params={"start_date": "2024-01-01T00:00:00", "end_date": "2024-01-31T23:59:59"}
+    )
+    assert response.status_code == 304
+
+
+@pytest.mark.asyncio
+async def test_deleting_subcategory_updates_budget_summary(client, auth_headers, category_id):
+    response = client.post("/api/subcategories/", headers=auth_headers, json={"name": "Flat", "category_id": category_id})
+    subcategory_id = response.json()["id"]
+    client.post(
+        "/api/budgets/",
+        headers=auth_headers,
+        json={"category_id": category_id, "subcategory_id": subcategory_id, "amount": 200.2, "start_date": "2024-01-01T00:00:00", "end_date": "2024-01-31T00:00:00"}
+    )
+    params = {"start_date": "2024-01-01T00:00:00", "end_date": "2024-01-31T23:59:59"}
+    
+    response = client.get("/api/budgets/summary", headers=auth_headers, params=params)
+    assert response.json()["total_budget"] == 200.2
+    
+    # The subcategory's budgets go with it, so the cached summary must not survive the delete
+    response = client.delete(f"/api/subcategories/{subcategory_id}", headers=auth_headers)
+    assert response.status_code == 204
+    
+    response = client.get("/api/budgets/summary", headers=auth_headers, params=params)
+    assert response.json()["total_budget"] == 0
@@ -0,0 +1,102 @@
+import pytest
+from fastapi.routing import APIRoute
+
+from app.main import app
+
+SUMMARY_URL = "/api/budgets/summary"
+SUMMARY_PARAMS = {"start_date": "2024-01-01T00:00:00", "end_date": "2024-01-31T23:59:59"}
+REPORT_URL = "/api/reports/monthly/2024/1"
+RATE_URL = "/api/settings/currencies/rates/latest"
+RATE_PARAMS = {"from_currency": "INR", "to_currency": "ZAR"}
+RATE = {"from_currency": "INR", "to_currency": "ZAR", "rate": 0.22, "effective_date": "2024-01-01T00:00:00"}
+
+# Every write route and the request that exercises it; ids are filled in from the seeded data
+WRITES = {
+    ("POST", "/api/categories/"): {"json": {"name": "Other", "type": "expense"}},
+    ("PUT", "/api/categories/{category_id}"): {"json": {"name": "Housing"}},
+    ("DELETE", "/api/categories/{category_id}"): {},
+    ("POST", "/api/subcategories/"): {"json": {"name": "Water", "category_id": "{category_id}"}},
+    ("PUT", "/api/subcategories/{subcategory_id}"): {"json": {"name": "House"}},
+    ("DELETE", "/api/subcategories/{subcategory_id}"): {},
+    ("POST", "/api/budgets/"): {
+        "json": {"category_id": "{category_id}", "amount": 50, "start_date": "2024-01-01T00:00:00", "end_date": "2024-01-31T00:00:00"}
+    },
+    ("PUT", "/api/budgets/{budget_id}"): {"json": {"amount": 300}},
+    ("DELETE", "/api/budgets/{budget_id}"): {},
+    ("POST", "/api/transactions/"): {
+        "json": {"category_id": "{category_id}", "amount": 5, "transaction_date": "2024-01-12T00:00:00", "description": "extra", "type": "expense"}
+    },
+    ("PUT", "/api/transactions/{transaction_id}"): {"json": {"amount": 45}},
+    ("DELETE", "/api/transactions/{transaction_id}"): {},
+    ("POST", "/api/settings/currencies/rates"): {
+        "json": {**RATE, "rate": 0.23, "effective_date": "2024-02-01T00:00:00"}
+    },
+}
+
+# Writes that change nothing behind a cached endpoint
+UNCACHED_WRITES = {
+    ("POST", "/api/auth/register"),
+    ("POST", "/api/auth/login"),
+    ("POST", "/api/auth/logout"),
+    ("PUT", "/api/settings/user/preferences"),
+}
+
+
+def fill_ids(value, ids):
+    if isinstance(value, dict):
+        return {key: fill_ids(item, ids) for key, item in value.items()}
+    if isinstance(value, str) and value.startswith("{"):
+        return ids[value[1:-1]]
+    return value
+
+
+def etags(client, auth_headers):
+    return (
+        client.get(SUMMARY_URL, headers=auth_headers, params=SUMMARY_PARAMS).headers["ETag"],
+        client.get(REPORT_URL, headers=auth_headers).headers["ETag"],
+        client.get(RATE_URL, headers=auth_headers, params=RATE_PARAMS).headers["ETag"],
+    )
+
+
+def test_every_write_route_is_covered():
+    routes = {
+        (method, route.path)
+        for route in app.routes if isinstance(route, APIRoute)
+        for method in route.methods - {"GET", "HEAD"}
+    }
+    assert routes == set(WRITES) | UNCACHED_WRITES
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("method, path", list(WRITES))
+async def test_write_changes_etag(client, auth_headers, method, path):
+    category_id = client.post("/api/categories/", headers=auth_headers, json={"name": "Rent", "type": "expense"}).json()["id"]
+    ids = {
+        "category_id": category_id,
+        "subcategory_id": client.post(
+            "/api/subcategories/", headers=auth_headers, json={"name": "Flat", "category_id": category_id}
+        ).json()["id"],
+        "budget_id": client.post(
+            "/api/budgets/",
+            headers=auth_headers,
+            json={"category_id": category_id, "amount": 1000, "start_date": "2024-01-01T00:00:00", "end_date": "2024-01-31T00:00:00"}
+        ).json()["id"],
+        "transaction_id": client.post(
+            "/api/transactions/",
+            headers=auth_headers,
+            json={"category_id": category_id, "amount": 40, "transaction_date": "2024-01-10T00:00:00", "description": "rent", "type": "expense"}
+        ).json()["id"],
+    }
+    client.post("/api/settings/currencies/rates", headers=auth_headers, json=RATE)
+    before = etags(client, auth_headers)
+    
+    response = client.request(method, path.format(**ids), headers=auth_headers, **fill_ids(WRITES[(method, path)], ids))
+    assert response.status_code < 300
+    
+    # Each write must invalidate whatever cache it feeds, or clients keep getting 304s for old data
+    after = etags(client, auth_headers)
+    if path.startswith("/api/settings"):
+        assert after[2] != before[2]
+    else:
+        assert after[0] != before[0]
+        assert after[1] != before[1]
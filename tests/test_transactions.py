@@ -0,0 +1,69 @@
+import pytest
+
+
+def create_category(client, auth_headers, name, type):
+    response = client.post("/api/categories/", headers=auth_headers, json={"name": name, "type": type})
+    return response.json()["id"]
+
+
+def create_transaction(client, auth_headers, **fields):
+    data = {"currency": "ZAR", "description": "test", "type": "expense", **fields}
+    return client.post("/api/transactions/", headers=auth_headers, json=data)
+
+
+@pytest.mark.asyncio
+async def test_create_and_list_transactions(client, auth_headers, no_lazy_loads):
+    category_id = create_category(client, auth_headers, "Food", "expense")
+    create_transaction(client, auth_headers, category_id=category_id, amount=10, transaction_date="2024-01-05T10:00:00")
+    response = create_transaction(client, auth_headers, category_id=category_id, amount=20, transaction_date="2024-01-06T10:00:00")
+    assert response.status_code == 201
+    assert response.json()["created_at"] is not None
+    
+    response = client.get("/api/transactions/", headers=auth_headers)
+    assert response.status_code == 200
+    data = response.json()
+    assert [transaction["amount"] for transaction in data] == [20, 10]
+
+
+@pytest.mark.asyncio
+async def test_transaction_type_must_match_category(client, auth_headers):
+    category_id = create_category(client, auth_headers, "Salary", "income")
+    response = create_transaction(client, auth_headers, category_id=category_id, amount=10, transaction_date="2024-01-05T10:00:00")
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_transaction_summary(client, auth_headers, no_lazy_loads):
+    food_id = create_category(client, auth_headers, "Food", "expense")
+    salary_id = create_category(client, auth_headers, "Salary", "income")
+    create_transaction(client, auth_headers, category_id=food_id, amount=10, transaction_date="2024-01-05T10:00:00")
+    create_transaction(client, auth_headers, category_id=food_id, amount=15, transaction_date="2024-01-20T10:00:00")
+    create_transaction(client, auth_headers, category_id=salary_id, amount=100, type="income", transaction_date="2024-01-25T10:00:00")
+    
+    response = client.get(
+        "/api/transactions/summary",
+        headers=auth_headers,
+        params={"start_date": "2024-01-01T00:00:00", "end_date": "2024-01-31T23:59:59"}
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total_income"] == 100
+    assert data["total_expense"] == 25
+    assert data["net_amount"] == 75
+    items = {item["category_name"]: item for item in data["items"]}
+    assert items["Food"]["total_amount"] == 25
+    assert items["Food"]["transaction_count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_deleting_category_deletes_its_transactions(client, auth_headers):
+    food_id = create_category(client, auth_headers, "Food", "expense")
+    rent_id = create_category(client, auth_headers, "Rent", "expense")
+    create_transaction(client, auth_headers, category_id=food_id, amount=10, transaction_date="2024-01-05T10:00:00")
+    create_transaction(client, auth_headers, category_id=rent_id, amount=500, transaction_date="2024-01-01T10:00:00")
+    
+    response = client.delete(f"/api/categories/{food_id}", headers=auth_headers)
+    assert response.status_code == 204
+    
+    response = client.get("/api/transactions/", headers=auth_headers)
+    assert [transaction["category_id"] for transaction in response.json()] == [rent_id]